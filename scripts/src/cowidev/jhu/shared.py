@@ -3,7 +3,9 @@ import pandas as pd
 import numpy as np
 import os
 from datetime import datetime
+from functools import lru_cache
 
+from cowidev.megafile.steps.jhu import export_jhu
 from cowidev.megafile.steps.test import get_testing
 from cowidev.utils import paths
 
@@ -21,11 +23,13 @@ zero_day = datetime.strptime(ZERO_DAY, "%Y-%m-%d")
 # =========
 
 
-def _find_closest_year_row(df, year=2021):
-    """Returns the row which is closest to the year specified (in either direction)"""
-    df = df.copy()
-    df["year"] = df["year"].sort_values(ascending=True)
-    return df.loc[df["year"].map(lambda x: abs(x - year)).idxmin()]
+def _find_closest_year_rows(df, year=2021, by="entity"):
+    """Returns, for each group in `by`, the row which is closest to the year specified (in either direction).
+
+    Ties are resolved in favour of the first row.
+    """
+    distance = (df["year"] - year).abs()
+    return df.loc[distance.groupby(df[by]).idxmin()]
 
 
 # ============
@@ -34,13 +38,18 @@ def _find_closest_year_row(df, year=2021):
 
 
 def load_population(year=2021):
+    return _load_population(year).copy()
+
+
+@lru_cache(maxsize=None)
+def _load_population(year):
     df = pd.read_csv(
         POPULATION_CSV_PATH,
         keep_default_na=False,
         usecols=["entity", "year", "population"],
     )
     return (
-        pd.DataFrame([_find_closest_year_row(df_group, year) for loc, df_group in df.groupby("entity")])
+        _find_closest_year_rows(df, year)
         .dropna()
         .rename(columns={"entity": "location", "year": "population_year"})
     )
@@ -56,7 +65,9 @@ def load_owid_continents():
     )
 
 
-locations_by_continent = load_owid_continents().groupby("continent")["location"].apply(list).to_dict()
+@lru_cache(maxsize=None)
+def get_locations_by_continent():
+    return load_owid_continents().groupby("continent")["location"].apply(list).to_dict()
 
 
 def load_wb_income_groups():
@@ -80,7 +91,9 @@ def load_eu_country_names():
     return df["location"].tolist()
 
 
-locations_by_wb_income_group = load_wb_income_groups().groupby("income_group")["location"].apply(list).to_dict()
+@lru_cache(maxsize=None)
+def get_locations_by_wb_income_group():
+    return load_wb_income_groups().groupby("income_group")["location"].apply(list).to_dict()
 
 
 # ==============
@@ -109,25 +122,47 @@ def inject_per_million(df, measures):
 # OWID continents + custom aggregates
 # ===================================
 
-aggregates_spec = {
-    "World": {"include": None, "exclude": None},
-    "World excl. China": {"exclude": ["China"]},
-    "World excl. China and South Korea": {"exclude": ["China", "South Korea"]},
-    "World excl. China, South Korea, Japan and Singapore": {"exclude": ["China", "South Korea", "Japan", "Singapore"]},
-    # European Union
-    "European Union": {"include": load_eu_country_names()},
-    # OWID continents
-    **{continent: {"include": locations, "exclude": None} for continent, locations in locations_by_continent.items()},
-    # Asia without China
-    "Asia excl. China": {"include": list(set(locations_by_continent["Asia"]) - set(["China"]))},
-    # World Bank income groups
-    **{
-        income_group: {"include": locations, "exclude": None}
-        for income_group, locations in locations_by_wb_income_group.items()
-    },
+@lru_cache(maxsize=None)
+def get_aggregates_spec():
+    locations_by_continent = get_locations_by_continent()
+    return {
+        "World": {"include": None, "exclude": None},
+        "World excl. China": {"exclude": ["China"]},
+        "World excl. China and South Korea": {"exclude": ["China", "South Korea"]},
+        "World excl. China, South Korea, Japan and Singapore": {
+            "exclude": ["China", "South Korea", "Japan", "Singapore"]
+        },
+        # European Union
+        "European Union": {"include": load_eu_country_names()},
+        # OWID continents
+        **{
+            continent: {"include": locations, "exclude": None}
+            for continent, locations in locations_by_continent.items()
+        },
+        # Asia without China
+        "Asia excl. China": {"include": list(set(locations_by_continent["Asia"]) - set(["China"]))},
+        # World Bank income groups
+        **{
+            income_group: {"include": locations, "exclude": None}
+            for income_group, locations in get_locations_by_wb_income_group().items()
+        },
+    }
+
+
+# Reference tables are loaded on first access, not on import
+_LAZY = {
+    "locations_by_continent": get_locations_by_continent,
+    "locations_by_wb_income_group": get_locations_by_wb_income_group,
+    "aggregates_spec": get_aggregates_spec,
 }
 
 
+def __getattr__(name):
+    if name in _LAZY:
+        return _LAZY[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _sum_aggregate(df, name, include=None, exclude=None):
     df = df.copy()
     if include:
@@ -143,7 +178,7 @@ def inject_owid_aggregates(df):
     return pd.concat(
         [
             df,
-            *[_sum_aggregate(df, name, **params) for name, params in aggregates_spec.items()],
+            *[_sum_aggregate(df, name, **params) for name, params in get_aggregates_spec().items()],
         ],
         sort=True,
         ignore_index=True,
@@ -523,7 +558,7 @@ def standard_export(df, output_path, grapher_name):
     # Table & public extracts for external users
     # Excludes aggregates
     excluded_aggregates = list(
-        set(aggregates_spec.keys())
+        set(get_aggregates_spec().keys())
         - set(
             [
                 "World",
@@ -554,4 +589,7 @@ def standard_export(df, output_path, grapher_name):
         cols = df_pivot.columns.tolist()
         cols.insert(0, cols.pop(cols.index("World")))
         df_pivot[cols].to_csv(os.path.join(output_path, "%s.csv" % col_name))
+    # Long-form table for the megafile, so that it does not need to melt the wide files above (written last, so that
+    # it is not older than them)
+    export_jhu(df_table, paths.SCRIPTS.TMP_JHU_COLUMNAR)
     return True
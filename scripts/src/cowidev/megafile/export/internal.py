@@ -1,10 +1,13 @@
 import os
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from json.encoder import encode_basestring_ascii
 
 import pandas as pd
 import numpy as np
 
 from cowidev.megafile.export.annotations import AnnotatorInternal, add_annotations_countries_100_percentage
-from cowidev.utils.utils import dict_to_compact_json
+from cowidev.utils.json_stream import encode_values
 
 
 COUNTRIES_WITH_PARTLY_VAX_METRIC = []
@@ -190,7 +193,7 @@ internal_files_columns = {
 }
 
 
-def create_internal(df: pd.DataFrame, output_dir: str, annotations_path: str, country_data: str):
+def create_internal(df: pd.DataFrame, output_dir: str, annotations_path: str, country_data: str, workers: int = None):
     # Ensure internal/ dir is created
     os.makedirs(output_dir, exist_ok=True)
 
@@ -227,16 +230,20 @@ def create_internal(df: pd.DataFrame, output_dir: str, annotations_path: str, co
     # Add total vaccinations without boosters
     df = df.pipe(add_total_vaccinations_no_boosters)
 
-    # Export
-    for name, config in internal_files_columns.items():
-        output_path = os.path.join(output_dir, f"megafile--{name}.json")
-        value_columns = list(set(config["columns"]) - set(non_value_columns))
-        df_output = df[config["columns"]]
-        if name == "vaccinations-boosters":
-            df_output = df_output.copy().pipe(fillna_boosters_till_valid)
-        df_output = df_output.dropna(subset=value_columns, how=config["dropna"])
-        df_output = annotator.add_annotations(df_output, name)
-        df_to_columnar_json(df_output, output_path)
+    # Export (files are written in parallel, by `workers` processes)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("fork")) as executor:
+        futures = []
+        for name, config in internal_files_columns.items():
+            output_path = os.path.join(output_dir, f"megafile--{name}.json")
+            value_columns = list(set(config["columns"]) - set(non_value_columns))
+            df_output = df[config["columns"]]
+            if name == "vaccinations-boosters":
+                df_output = df_output.copy().pipe(fillna_boosters_till_valid)
+            df_output = df_output.dropna(subset=value_columns, how=config["dropna"])
+            df_output = annotator.add_annotations(df_output, name)
+            futures.append(executor.submit(df_to_columnar_json, df_output, output_path))
+        for future in futures:
+            future.result()
 
 
 def add_partially_vaccinated(df: pd.DataFrame, country_data: str):
@@ -299,10 +306,11 @@ def df_to_columnar_json(complete_dataset, output_path):
             "date": ["2020-03-01", "2020-03-02", ... ]
         }
     """
-    # Replace NaNs with None in order to be serializable to JSON.
-    # JSON doesn't support NaNs, but it does have null which is represented as None in Python.
-    columnar_dict = complete_dataset.to_dict(orient="list")
-    for k, v in columnar_dict.items():
-        columnar_dict[k] = [x if pd.notnull(x) else None for x in v]
+    # Each column is encoded at once. NA values are written as null (JSON has no NaN).
     with open(output_path, "w") as file:
-        file.write(dict_to_compact_json(columnar_dict))
+        file.write("{")
+        for i, col in enumerate(complete_dataset.columns):
+            values = encode_values(complete_dataset[col])
+            values[pd.isna(values)] = "null"
+            file.write(("," if i else "") + encode_basestring_ascii(col) + ":[" + ",".join(values) + "]")
+        file.write("}")
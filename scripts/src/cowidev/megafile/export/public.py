@@ -1,13 +1,20 @@
+import io
 import os
+import tempfile
 from datetime import date, timedelta
+from json.encoder import encode_basestring_ascii
 
+import numpy as np
 import pandas as pd
 
+from cowidev.utils.json_stream import encode_values
 from cowidev.utils.s3 import S3, obj_to_s3
-from cowidev.utils.utils import get_project_dir, dict_to_compact_json
+from cowidev.utils.utils import get_project_dir
 
 
 DATA_DIR = os.path.abspath(os.path.join(get_project_dir(), "public", "data"))
+# Approximate number of rows encoded at a time by `write_megajson`
+CHUNK_ROWS = 10000
 
 
 def create_dataset(df, macro_variables):
@@ -24,12 +31,10 @@ def create_dataset(df, macro_variables):
     obj_to_s3(df, s3_path="s3://covid-19/public/owid-covid-data.xlsx", public=True)
 
     print("Writing to JSON…")
-    data = df_to_dict(
-        df,
-        macro_variables.keys(),
-        valid_json=True,
-    )
-    obj_to_s3(data, "s3://covid-19/public/owid-covid-data.json", public=True)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = os.path.join(tmp_dir, "owid-covid-data.json")
+        df_to_json(df, filename, macro_variables.keys())
+        S3().upload_to_s3(filename, "s3://covid-19/public/owid-covid-data.json", public=True)
 
 
 def create_latest(df):
@@ -37,9 +42,9 @@ def create_latest(df):
     df = df[df.date >= str(date.today() - timedelta(weeks=2))]
     df = df.sort_values("date")
 
-    latest = [df[df.location == loc].ffill().tail(1).round(3) for loc in set(df.location)]
-    latest = pd.concat(latest)
-    latest = latest.sort_values("location").rename(columns={"date": "last_updated_date"})
+    # Last valid value of each column, per location (i.e. last row after forward-filling)
+    latest = df.groupby("location", as_index=False, sort=True).last()[df.columns].round(3)
+    latest = latest.rename(columns={"date": "last_updated_date"})
 
     print("Writing latest version…")
     # CSV
@@ -68,6 +73,11 @@ def df_to_dict(complete_dataset, static_columns, valid_json=False):
     NA values are dropped from the output.
     Macro variables are normalized by appearing only once, at the root of each ISO code.
     """
+    if valid_json:
+        with io.StringIO() as f:
+            write_megajson(complete_dataset, f, static_columns)
+            return f.getvalue()
+
     megajson = {}
 
     static_columns = ["continent", "location"] + list(static_columns)
@@ -82,8 +92,6 @@ def df_to_dict(complete_dataset, static_columns, valid_json=False):
             {k: v for k, v in r.items() if pd.notnull(v)}
             for r in country_df.drop(columns=static_columns).to_dict("records")
         ]
-    if valid_json:
-        megajson = dict_to_compact_json(megajson)
     return megajson
 
 
@@ -93,6 +101,56 @@ def df_to_json(complete_dataset, output_path, static_columns):
     NA values are dropped from the output.
     Macro variables are normalized by appearing only once, at the root of each ISO code.
     """
-    megajson = df_to_dict(complete_dataset, static_columns, valid_json=True)
     with open(output_path, "w") as file:
-        file.write(megajson)
+        write_megajson(complete_dataset, file, static_columns)
+
+
+def write_megajson(complete_dataset, f, static_columns, chunk_rows=CHUNK_ROWS):
+    """
+    Writes the JSON version of the complete dataset to text file `f`, as compact JSON (same output as
+    `dict_to_compact_json(df_to_dict(...))`).
+
+    Rows are walked once, grouped by ISO code (in order of first appearance). Values are encoded column by column, for
+    chunks of whole ISO codes of about `chunk_rows` rows, and each chunk is written before encoding the next one.
+    """
+    static_columns = ["continent", "location"] + list(static_columns)
+
+    data_columns = [col for col in complete_dataset.columns if col != "iso_code" and col not in static_columns]
+    keys_static = {col: encode_basestring_ascii(col) for col in static_columns}
+    keys_data = {col: "," + encode_basestring_ascii(col) + ":" for col in data_columns}
+
+    # Rows grouped by ISO code (rows without one are left out), and first and last row of each group
+    codes, isos = pd.factorize(complete_dataset.iso_code)
+    order = np.argsort(codes, kind="stable")
+    order = order[codes[order] >= 0]
+    starts = np.r_[0, np.flatnonzero(np.diff(codes[order])) + 1][: len(isos)]
+    ends = np.r_[starts[1:], len(order)]
+
+    f.write("{")
+    i = 0
+    while i < len(isos):
+        j = max(np.searchsorted(starts, starts[i] + chunk_rows), i + 1)
+        chunk = complete_dataset.iloc[order[starts[i]:ends[j - 1]]]
+        firsts = starts[i:j] - starts[i]
+        # Static data, from the first row of each ISO code
+        static = {col: encode_values(chunk[col].iloc[firsts]) for col in static_columns}
+        # Data, one object per row (members with NA values are left out)
+        members = np.full(len(chunk), "", dtype=object)
+        for col in data_columns:
+            values = encode_values(chunk[col])
+            mask = pd.notna(values)
+            members[mask] += keys_data[col] + values[mask]
+        rows = ["{" + r[1:] + "}" for r in members]
+        for k in range(j - i):
+            f.write("," if i + k else "")
+            f.write(encode_basestring_ascii(str(isos[i + k])) + ":{")
+            f.write(
+                "".join(
+                    keys_static[col] + ":" + static[col][k] + ","
+                    for col in static_columns
+                    if static[col][k] is not None
+                )
+            )
+            f.write('"data":[' + ",".join(rows[starts[i + k] - starts[i]:ends[i + k] - starts[i]]) + "]}")
+        i = j
+    f.write("}")
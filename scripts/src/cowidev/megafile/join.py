@@ -0,0 +1,123 @@
+"""Join of several data sources on shared key columns (e.g. location and date).
+
+Keys of all sources are mapped once to a dense integer code (one code per key column, combined into a single integer),
+and each source is aligned to the joined keys by array indexing. Each column of the result is allocated once, whereas
+chained `pd.merge` calls rehash the string keys and copy all accumulated columns at every step.
+"""
+import resource
+import time
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import take
+
+
+class SourceJoiner:
+    """Join data sources on key columns.
+
+    Rows of the result are the union of the keys of sources added with `how="outer"`, sorted by the key columns (in the
+    order given by `on`). Sources added with `how="left"` only contribute values for those keys. This is equivalent to
+    chaining `pd.merge` calls (outer or left) and sorting, provided that keys are unique within each source and that
+    sources have no other columns in common (both are checked). Rows with missing keys are dropped.
+
+    Args:
+        on (list): Key columns.
+    """
+
+    def __init__(self, on: list):
+        self.on = list(on)
+        self.sources = []
+        self.stats = {}
+
+    def add(self, name: str, df: pd.DataFrame, how: str = "outer"):
+        """Add source `df`, identified by `name` in errors and statistics."""
+        if how not in ["outer", "left"]:
+            raise ValueError(f"{name}: `how` must be 'outer' or 'left', found {how}")
+        missing = set(self.on).difference(df.columns)
+        if missing:
+            raise ValueError(f"{name}: key columns {missing} not found")
+        columns = set(df.columns).difference(self.on)
+        for name_other, df_other, _ in self.sources:
+            common = columns.intersection(df_other.columns)
+            if common:
+                raise ValueError(f"{name}: columns {common} already present in source {name_other}")
+        self.sources.append((name, df.dropna(subset=self.on), how))
+        self.stats.setdefault(name, {})
+        return self
+
+    def load(self, name: str, func, *args, how: str = "outer", **kwargs):
+        """Add source returned by `func(*args, **kwargs)`, recording time spent loading it."""
+        t0 = time.time()
+        df = func(*args, **kwargs)
+        self.add(name, df, how)
+        self.stats[name].update({"load (sec)": round(time.time() - t0, 2), "peak memory (MB)": _peak_memory_mb()})
+        return self
+
+    def join(self) -> pd.DataFrame:
+        """Join all sources."""
+        t0_join = time.time()
+        if not self.sources:
+            raise ValueError("No sources to join")
+        # Dense integer code of each key (sorted)
+        categories = [
+            np.sort(pd.unique(np.concatenate([df[col].values for _, df, _ in self.sources]))) for col in self.on
+        ]
+        strides = np.cumprod([1] + [len(c) for c in categories[:0:-1]])[::-1]
+        codes = [self._encode(df, categories, strides) for _, df, _ in self.sources]
+        # Keys of the result (sorted), and position of each key code in the result
+        present = np.zeros(int(np.prod([len(c) for c in categories])), dtype=bool)
+        for codes_src, (_, _, how) in zip(codes, self.sources):
+            if how == "outer":
+                present[codes_src] = True
+        keys = np.flatnonzero(present)
+        rank = np.cumsum(present) - 1
+        # Key columns
+        columns = {
+            col: cats[(keys // stride) % len(cats)] for col, cats, stride in zip(self.on, categories, strides)
+        }
+        # Align sources
+        for (name, df, _), codes_src in zip(self.sources, codes):
+            t0 = time.time()
+            if len(codes_src) and np.bincount(codes_src).max() > 1:
+                raise ValueError(f"{name}: found several rows for the same {self.on}")
+            found = present[codes_src]
+            indexer = np.full(len(keys), -1, dtype=np.intp)
+            indexer[rank[codes_src[found]]] = np.flatnonzero(found)
+            for col in df.columns.difference(self.on, sort=False):
+                columns[col] = take(df[col].values, indexer, allow_fill=True)
+            self.stats[name].update(
+                {
+                    "rows": len(df),
+                    "columns": len(df.columns) - len(self.on),
+                    "align (sec)": round(time.time() - t0, 2),
+                }
+            )
+        # Column order as in chained merges: first source's columns, then the rest
+        order = list(self.sources[0][1].columns) + [col for col in columns if col not in self.sources[0][1].columns]
+        df = pd.DataFrame({col: columns[col] for col in order})
+        self.stats["(join)"] = {
+            "rows": len(df),
+            "columns": len(df.columns),
+            "align (sec)": round(time.time() - t0_join, 2),
+            "peak memory (MB)": _peak_memory_mb(),
+        }
+        return df
+
+    def report(self) -> pd.DataFrame:
+        """Get statistics per source.
+
+        These are the time spent loading and aligning each source, and the peak memory of the process after loading it.
+        Row `(join)` has the totals of the join.
+        """
+        return pd.DataFrame.from_dict(self.stats, orient="index")
+
+    def _encode(self, df, categories, strides):
+        code = np.zeros(len(df), dtype=np.int64)
+        for col, cats, stride in zip(self.on, categories, strides):
+            code += pd.Categorical(df[col], categories=cats).codes.astype(np.int64) * stride
+        return code
+
+
+def _peak_memory_mb():
+    # Peak resident memory of the process so far (kilobytes on Linux)
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
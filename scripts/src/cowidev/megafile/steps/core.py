@@ -1,6 +1,8 @@
 import os
 
+from cowidev.utils import paths
 from cowidev.utils.utils import get_project_dir
+from cowidev.megafile.join import SourceJoiner
 from cowidev.megafile.steps.cgrt import get_cgrt
 from cowidev.megafile.steps.hosp import get_hosp
 from cowidev.megafile.steps.jhu import get_jhu
@@ -17,44 +19,60 @@ DATA_DIR = os.path.abspath(os.path.join(get_project_dir(), "public", "data"))
 
 def get_base_dataset():
     """Get owid datasets from: jhu, reproduction rate, hospitalizations, testing ,vaccinations, CGRT."""
+    sources = SourceJoiner(on=["location", "date"])
+
     print("Fetching JHU dataset…")
-    jhu = get_jhu(jhu_dir=os.path.join(get_project_dir(), "public", "data", "jhu"))
+    sources.load(
+        "jhu",
+        get_jhu,
+        jhu_dir=os.path.join(get_project_dir(), "public", "data", "jhu"),
+        jhu_columnar=paths.SCRIPTS.TMP_JHU_COLUMNAR,
+    )
 
     print("Fetching reproduction rate…")
-    reprod = get_reprod(
+    sources.load(
+        "reprod",
+        get_reprod,
         file_url="https://github.com/crondonm/TrackingR/raw/main/Estimates-Database/database.csv",
         country_mapping=os.path.join(INPUT_DIR, "reproduction", "reprod_country_standardized.csv"),
     )
 
     print("Fetching hospital dataset…")
-    hosp = get_hosp(data_file=os.path.join(GRAPHER_DIR, "COVID-2019 - Hospital & ICU.csv"))
+    sources.load("hosp", get_hosp, data_file=os.path.join(GRAPHER_DIR, "COVID-2019 - Hospital & ICU.csv"))
 
     print("Fetching testing dataset…")
-    testing = get_testing()
+    sources.load("testing", get_testing)
 
     print("Fetching vaccination dataset…")
-    vax = get_vax(data_file=os.path.join(DATA_DIR, "vaccinations", "vaccinations.csv"))
-    vax = vax[-vax.location.isin(["England", "Northern Ireland", "Scotland", "Wales"])]
+    sources.load("vax", _get_vax_national)
 
     print("Fetching OxCGRT dataset…")
-    cgrt = get_cgrt(
+    sources.load(
+        "cgrt",
+        get_cgrt,
+        how="left",
         bsg_latest=os.path.join(INPUT_DIR, "bsg", "latest.csv"),
         country_mapping=os.path.join(INPUT_DIR, "bsg", "bsg_country_standardised.csv"),
     )
 
     print("Fetching variants dataset…")
-    variants = get_variants(
+    sources.load(
+        "variants",
+        get_variants,
+        how="left",
         variants_file="s3://covid-19/internal/variants/covid-variants.csv",
         cases_file=os.path.join(DATA_DIR, "jhu", "full_data.csv"),
     )
 
     # Big merge
-    return (
-        jhu.merge(reprod, on=["date", "location"], how="outer")
-        .merge(hosp, on=["date", "location"], how="outer")
-        .merge(testing, on=["date", "location"], how="outer")
-        .merge(vax, on=["date", "location"], how="outer")
-        .merge(cgrt, on=["date", "location"], how="left")
-        .merge(variants, on=["date", "location"], how="left")
-        .sort_values(["location", "date"])
+    df = sources.join()
+    print(sources.report())
+    return df
+
+
+def _get_vax_national():
+    vax = get_vax(
+        data_file=os.path.join(DATA_DIR, "vaccinations", "vaccinations.csv"),
+        data_file_columnar=paths.SCRIPTS.TMP_VAX_DATASET_COLUMNAR,
     )
+    return vax[-vax.location.isin(["England", "Northern Ireland", "Scotland", "Wales"])]
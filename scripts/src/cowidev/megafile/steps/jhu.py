@@ -1,39 +1,58 @@
 "merge"
 import os
-from functools import reduce
 import pandas as pd
 
+from cowidev.megafile.join import SourceJoiner
+from cowidev.utils.columnar import export_columnar, is_fresh, read_columnar
 
-def get_jhu(jhu_dir: str):
+
+JHU_VARIABLES = [
+    "total_cases",
+    "new_cases",
+    "weekly_cases",
+    "total_deaths",
+    "new_deaths",
+    "weekly_deaths",
+    "total_cases_per_million",
+    "new_cases_per_million",
+    "weekly_cases_per_million",
+    "total_deaths_per_million",
+    "new_deaths_per_million",
+    "weekly_deaths_per_million",
+]
+JHU_RENAME_WEEKLY = {
+    "weekly_cases": "new_cases_smoothed",
+    "weekly_deaths": "new_deaths_smoothed",
+    "weekly_cases_per_million": "new_cases_smoothed_per_million",
+    "weekly_deaths_per_million": "new_deaths_smoothed_per_million",
+}
+
+
+def get_jhu(jhu_dir: str, jhu_columnar: str = None):
     """
     Reads each COVID-19 JHU dataset located in /public/data/jhu/
     Melts the dataframe to vertical format (1 row per country and date)
     Merges all JHU dataframes into one with outer joins
 
+    If `jhu_columnar` is given and it is not older than the files in `jhu_dir`, the table is read from it instead (see
+    `export_jhu`).
+
     Returns:
         jhu {dataframe}
     """
+    jhu_files = [os.path.join(jhu_dir, f"{jhu_var}.csv") for jhu_var in JHU_VARIABLES]
+    if jhu_columnar is not None and is_fresh(jhu_columnar, *jhu_files):
+        jhu = read_columnar(jhu_columnar)
+        # Dates must be strings to be joined with other sources (a file with other types is ignored)
+        if pd.api.types.infer_dtype(jhu.date) == "string":
+            return jhu
+        print(f"{jhu_columnar}: `date` must be strings, found {pd.api.types.infer_dtype(jhu.date)}. Reading {jhu_dir}")
 
-    jhu_variables = [
-        "total_cases",
-        "new_cases",
-        "weekly_cases",
-        "total_deaths",
-        "new_deaths",
-        "weekly_deaths",
-        "total_cases_per_million",
-        "new_cases_per_million",
-        "weekly_cases_per_million",
-        "total_deaths_per_million",
-        "new_deaths_per_million",
-        "weekly_deaths_per_million",
-    ]
-
-    data_frames = []
+    sources = SourceJoiner(on=["date", "location"])
 
     # Process each file and melt it to vertical format
-    for jhu_var in jhu_variables:
-        tmp = pd.read_csv(os.path.join(jhu_dir, f"{jhu_var}.csv"))
+    for jhu_var, jhu_file in zip(JHU_VARIABLES, jhu_files):
+        tmp = pd.read_csv(jhu_file)
         country_cols = list(tmp.columns)
         country_cols.remove("date")
 
@@ -45,28 +64,60 @@ def get_jhu(jhu_dir: str):
         tmp = (
             pd.melt(tmp, id_vars="date", value_vars=country_cols)
             .rename(columns={"value": jhu_var, "variable": "location"})
-            .dropna()
+            .dropna(subset=[jhu_var])
         )
 
         if jhu_var[:7] == "weekly_":
             tmp[jhu_var] = tmp[jhu_var].div(7).round(3)
-            tmp = tmp.rename(
-                errors="ignore",
-                columns={
-                    "weekly_cases": "new_cases_smoothed",
-                    "weekly_deaths": "new_deaths_smoothed",
-                    "weekly_cases_per_million": "new_cases_smoothed_per_million",
-                    "weekly_deaths_per_million": "new_deaths_smoothed_per_million",
-                },
-            )
+            tmp = tmp.rename(errors="ignore", columns=JHU_RENAME_WEEKLY)
         else:
             tmp[jhu_var] = tmp[jhu_var].round(3)
-        data_frames.append(tmp)
+        sources.add(jhu_var, tmp)
 
     # Outer join between all files
-    jhu = reduce(
-        lambda left, right: pd.merge(left, right, on=["date", "location"], how="outer"),
-        data_frames,
-    )
+    jhu = sources.join()
 
     return jhu
+
+
+def build_jhu(df: pd.DataFrame):
+    """
+    Builds the table returned by `get_jhu` directly from the long-form JHU table that the files in /public/data/jhu/
+    are pivoted from (one row per location and date).
+
+    Returns:
+        jhu {dataframe}
+    """
+    df = df[["date", "location"] + JHU_VARIABLES].astype({jhu_var: float for jhu_var in JHU_VARIABLES})
+    # Dates as in the wide files (and all other megafile sources), e.g. not `datetime.date` objects
+    df = df.assign(date=pd.to_datetime(df.date).dt.strftime("%Y-%m-%d"))
+
+    # Carrying last observation forward for International totals to avoid discrepancies. As in the wide files, this
+    # is done over all dates of the table, so International gets a row for dates it has no data for.
+    if (df.location == "International").any():
+        totals = [jhu_var for jhu_var in JHU_VARIABLES if jhu_var[:5] == "total"]
+        intl = (
+            df[df.location == "International"]
+            .set_index("date")
+            .reindex(pd.Index(df.date.unique(), name="date").sort_values())
+            .assign(location="International")
+            .reset_index()
+        )
+        intl[totals] = intl[totals].ffill()
+        df = pd.concat([df[df.location != "International"], intl], ignore_index=True)
+
+    # Rows with no value at all are not in any of the melted files
+    df = df.dropna(subset=JHU_VARIABLES, how="all")
+
+    weekly = [jhu_var for jhu_var in JHU_VARIABLES if jhu_var[:7] == "weekly_"]
+    others = [jhu_var for jhu_var in JHU_VARIABLES if jhu_var[:7] != "weekly_"]
+    df[weekly] = df[weekly].div(7).round(3)
+    df[others] = df[others].round(3)
+    df = df.rename(columns=JHU_RENAME_WEEKLY)
+
+    return df.sort_values(["date", "location"]).reset_index(drop=True)
+
+
+def export_jhu(df: pd.DataFrame, jhu_columnar: str):
+    """Exports the table built by `build_jhu` from the long-form JHU table `df`, to be read by `get_jhu`."""
+    export_columnar(build_jhu(df), jhu_columnar)
@@ -1,11 +1,14 @@
 import numpy as np
 import pandas as pd
 
+from cowidev.utils.columnar import read_intermediate
 
-def get_vax(data_file):
-    vax = pd.read_csv(
+
+def get_vax(data_file, data_file_columnar):
+    vax = read_intermediate(
         data_file,
-        usecols=[
+        data_file_columnar,
+        columns=[
             "location",
             "date",
             "total_vaccinations",
@@ -23,6 +26,9 @@ def get_vax(data_file):
             "daily_people_vaccinated_per_hundred",
         ],
     )
+    # Columnar copy keeps dtypes: nullable integers and parsed dates
+    vax = vax.astype({col: float for col in vax.select_dtypes("Int64").columns})
+    vax = vax.assign(date=pd.to_datetime(vax.date).dt.strftime("%Y-%m-%d"))
     vax = vax.rename(
         columns={
             "daily_vaccinations_raw": "new_vaccinations",
@@ -3,6 +3,7 @@ import os
 import pandas as pd
 
 from cowidev.utils import paths
+from cowidev.utils.utils import merge_with_csv
 
 
 COLUMNS_ORDER = [
@@ -83,7 +84,5 @@ class CountryTestBase:
 
 
 def merge_with_current_data(df: pd.DataFrame, filepath: str) -> pd.DataFrame:
-    df_current = pd.read_csv(filepath)
-    df_current = df_current[df_current.Date < df.Date.min()]
-    df = pd.concat([df_current, df]).sort_values("Date")
-    return df
+    # Current data from the first date in `df` on is replaced
+    return merge_with_csv(df, filepath, on="Date", older_only=True)
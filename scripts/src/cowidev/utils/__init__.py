@@ -1,10 +1,17 @@
-from cowidev.utils.web import get_soup
-from cowidev.utils.clean import clean_date, clean_date_series, clean_count
+import importlib
 
 
-__all__ = [
-    "get_soup",
-    "clean_date",
-    "clean_date_series",
-    "clean_count",
-]
+# Imported on first access, so that e.g. `from cowidev.utils import paths` does not load scraping libraries
+_EXPORTS = {
+    "get_soup": "cowidev.utils.web",
+    "clean_date": "cowidev.utils.clean",
+    "clean_date_series": "cowidev.utils.clean",
+    "clean_count": "cowidev.utils.clean",
+}
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,65 @@
+"""Typed columnar copies of CSV files handed over between pipeline stages.
+
+Stages that only pass a table on to the next stage can write, next to the CSV meant for users, a columnar copy in Arrow
+IPC format (Feather v2). Unlike the CSV, it keeps column dtypes (e.g. nullable `Int64`, datetimes), and is read through
+a memory map instead of being parsed. The next stage reads the columnar copy if it is at least as recent as the CSV,
+and falls back to the CSV otherwise (e.g. if the CSV was edited by hand).
+"""
+import os
+
+import pandas as pd
+from pyarrow import feather
+
+from cowidev.utils.utils import atomic_open
+
+
+def export_intermediate(df: pd.DataFrame, path: str, path_columnar: str):
+    """Export `df` as CSV to `path`, and as Arrow IPC to `path_columnar`.
+
+    Both files are written atomically, the columnar copy last (so that it is never older than the CSV it mirrors).
+    """
+    with atomic_open(path, "w", encoding="utf-8", newline="") as f:
+        df.to_csv(f, index=False)
+    export_columnar(df, path_columnar)
+
+
+def export_columnar(df: pd.DataFrame, path_columnar: str):
+    """Export `df` as Arrow IPC to `path_columnar` (atomically)."""
+    os.makedirs(os.path.dirname(os.path.abspath(path_columnar)), exist_ok=True)
+    with atomic_open(path_columnar, "wb") as f:
+        # Uncompressed, so that it can be memory-mapped
+        feather.write_feather(df.reset_index(drop=True), f, compression="uncompressed")
+
+
+def read_columnar(path_columnar: str, columns: list = None) -> pd.DataFrame:
+    """Read table exported with `export_columnar`."""
+    return feather.read_table(path_columnar, columns=columns, memory_map=True).to_pandas()
+
+
+def read_intermediate(path: str, path_columnar: str, columns: list = None, **kwargs) -> pd.DataFrame:
+    """Read table exported with `export_intermediate`.
+
+    Args:
+        path (str): Path to the CSV file.
+        path_columnar (str): Path to its columnar copy. Used if it exists and is not older than the CSV file.
+        columns (list, optional): Columns to load. Defaults to None (all columns).
+        kwargs: Other arguments for `pd.read_csv`, used only if the CSV file is read.
+    """
+    if is_fresh(path_columnar, path):
+        return read_columnar(path_columnar, columns=columns)
+    return pd.read_csv(path, usecols=columns, **kwargs)
+
+
+def is_fresh(path_columnar: str, *paths: str) -> bool:
+    """Check that `path_columnar` exists and is not older than any of the (existing) files in `paths`."""
+    try:
+        mtime_columnar = os.stat(path_columnar).st_mtime
+    except FileNotFoundError:
+        return False
+    for path in paths:
+        try:
+            if mtime_columnar < os.stat(path).st_mtime:
+                return False
+        except FileNotFoundError:
+            pass
+    return True
@@ -0,0 +1,167 @@
+"""Streaming read and write of JSON arrays.
+
+`write_json_array` encodes the elements of a JSON array one at a time, so they never need to be in memory all at
+once. Its default output is identical to `json.dump(list(objects), f, indent=2)`. `iter_json_array` reads such a file
+back, yielding one element at a time. `encode_values` encodes a whole column of a DataFrame at once, for writers that
+assemble JSON from encoded columns.
+"""
+import json
+from json.encoder import encode_basestring_ascii
+
+import numpy as np
+import pandas as pd
+
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def write_json_array(objects, f, compact: bool = False, **kwargs):
+    """Write iterable `objects` as a JSON array, one element at a time.
+
+    Args:
+        objects (iterable): Elements of the array. Can be a generator.
+        f (str or file): Path or text file object to write to.
+        compact (bool, optional): Set to True to write without indentation or whitespace. Defaults to False
+                                    (indentation of 2 spaces, as `json.dump(..., indent=2)`).
+        kwargs: Other arguments for `json.dumps`.
+    """
+    if isinstance(f, str):
+        with open(f, "w") as fw:
+            return write_json_array(objects, fw, compact=compact, **kwargs)
+    if compact:
+        kwargs = {**kwargs, "separators": (",", ":")}
+        start, sep, end = "[", ",", "]"
+    else:
+        kwargs = {**kwargs, "indent": 2}
+        start, sep, end = "[\n  ", ",\n  ", "\n]"
+    empty = True
+    for obj in objects:
+        s = json.dumps(obj, **kwargs)
+        if not compact:
+            s = s.replace("\n", "\n  ")
+        f.write(start if empty else sep)
+        f.write(s)
+        empty = False
+    f.write("[]" if empty else end)
+
+
+def encode_values(s: pd.Series) -> np.ndarray:
+    """Encode each value of `s` as compact JSON.
+
+    Values are encoded as `json.dumps(..., allow_nan=False)` would encode the native Python value of each cell (e.g.
+    as given by `s.tolist()`).
+
+    Returns:
+        np.ndarray: Object array with the encoded values, and None where `s` is NA.
+
+    Raises:
+        ValueError: If `s` has infinite values, which are not valid JSON.
+    """
+    mask = s.notna().to_numpy()
+    values = s.to_numpy()[mask]
+    encoded = np.full(len(s), None, dtype=object)
+    if s.dtype.kind == "f":
+        values = np.asarray(values, dtype=float)
+        if not np.isfinite(values).all():
+            raise ValueError(f"{s.name}: Out of range float values are not JSON compliant")
+        encoded[mask] = list(map(float.__repr__, values.tolist()))
+    elif s.dtype.kind in "iu":
+        encoded[mask] = [str(int(v)) for v in values.tolist()]
+    elif s.dtype.kind == "b":
+        encoded[mask] = np.where(np.asarray(values, dtype=bool), "true", "false")
+    else:
+        encoded[mask] = [_encode_value(v) for v in values]
+    return encoded
+
+
+def _encode_value(v):
+    if isinstance(v, str):
+        return encode_basestring_ascii(v)
+    if isinstance(v, np.generic):
+        v = v.item()
+    return json.dumps(v, separators=(",", ":"), allow_nan=False)
+
+
+def iter_json_array(f, chunk_size: int = CHUNK_SIZE):
+    """Iterate over the elements of a JSON array stored in a file, without loading the whole file.
+
+    Args:
+        f (str or file): Path or text file object to read from.
+        chunk_size (int, optional): Number of characters read at a time. Defaults to 1M.
+
+    Yields:
+        object: Elements of the array.
+    """
+    if isinstance(f, str):
+        with open(f) as fr:
+            yield from iter_json_array(fr, chunk_size=chunk_size)
+        return
+    reader = _Reader(f, chunk_size)
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.decode()
+        if reader.expect(",]") == "]":
+            return
+
+
+class _Reader:
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _read(self, size=None):
+        chunk = self.f.read(size or self.chunk_size)
+        self.eof = not chunk
+        self.buffer, self.pos = self.buffer[self.pos:] + chunk, 0
+
+    def peek(self):
+        """Get next non-whitespace character, without consuming it."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos] if self.pos < len(self.buffer) else ""
+            self._read()
+
+    def expect(self, chars):
+        """Consume next non-whitespace character, which must be one of `chars`."""
+        c = self.peek()
+        if not c or c not in chars:
+            raise ValueError(f"Invalid JSON array: expected one of {list(chars)}, found {c!r}")
+        self.pos += 1
+        return c
+
+    def decode(self):
+        """Decode next value, reading more data while it is incomplete.
+
+        Each attempt parses the value from its start, so the size read after a failed attempt doubles (the total work
+        stays linear in the size of the value, also for values much larger than `chunk_size`).
+        """
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self._read(size)
+                size *= 2
+                continue
+            # Values not followed by a delimiter might continue in the next chunk (e.g. `2.` of `2.5`, `1e` of `1e3`)
+            if not self.eof and (end == len(self.buffer) or not self._is_delimiter(self.buffer[end])):
+                self._read(size)
+                size *= 2
+                continue
+            self.pos = end
+            return obj
+
+    @staticmethod
+    def _is_delimiter(c):
+        return c in ",]" or c.isspace()
@@ -70,6 +70,13 @@ def _get_scripts_dir(project_dir: str):
         "TMP": os.path.join(_SCRIPTS_DIR, "tmp"),
         "TMP_VAX": os.path.join(_SCRIPTS_DIR, "vaccinations.preliminary.csv"),
         "TMP_VAX_META": os.path.join(_SCRIPTS_DIR, "metadata.preliminary.csv"),
+        "TMP_VAX_MANIFEST": os.path.join(_SCRIPTS_DIR, "tmp", "vaccinations.manifest.json"),
+        "TMP_VAX_GENERATE_STATE": os.path.join(_SCRIPTS_DIR, "tmp", "vaccinations.generate.pkl"),
+        # Columnar copies of vaccinations.preliminary.csv and public vaccinations.csv, read by the next step
+        "TMP_VAX_COLUMNAR": os.path.join(_SCRIPTS_DIR, "tmp", "vaccinations.preliminary.feather"),
+        "TMP_VAX_DATASET_COLUMNAR": os.path.join(_SCRIPTS_DIR, "tmp", "vaccinations.feather"),
+        # Long-form JHU table for the megafile (public/data/jhu/ only has wide files)
+        "TMP_JHU_COLUMNAR": os.path.join(_SCRIPTS_DIR, "tmp", "jhu.feather"),
     }
     _scripts_dirs = {**_scripts_dirs, "INPUT_CDC_VAX": os.path.join(_scripts_dirs["INPUT_CDC"], "vaccinations")}
     B = make_dataclass("Bucket", _scripts_dirs.keys(), frozen=True)
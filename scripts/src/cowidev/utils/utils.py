@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import json
@@ -84,3 +85,56 @@ def check_known_columns(df: pd.DataFrame, known_cols: list) -> None:
     unknown_cols = set(df.columns).difference(set(known_cols))
     if len(unknown_cols) > 0:
         raise Exception(f"Unknown column(s) found: {unknown_cols}")
+
+
+def merge_with_csv(df: pd.DataFrame, filepath: str, on, older_only: bool = False) -> pd.DataFrame:
+    """Merge `df` with the data currently in CSV file `filepath`, by key column(s) `on`.
+
+    By default, rows of the current data whose key is in `df` are replaced by those in `df` (upsert). With
+    `older_only`, only rows of the current data older than all of `df` (by the first key column) are kept.
+
+    Args:
+        df (pd.DataFrame): New data.
+        filepath (str): Path to the CSV file with the current data. If it does not exist, `df` is returned as is.
+        on (str or list): Key column(s).
+        older_only (bool, optional): Set to True to drop all current data from the first key in `df` on. Defaults to
+                                        False.
+
+    Returns:
+        pd.DataFrame: Merged data, sorted by key.
+    """
+    if not os.path.isfile(filepath):
+        return df
+    keys = [on] if isinstance(on, str) else list(on)
+    df_current = pd.read_csv(filepath)
+    if older_only:
+        df_current = df_current[df_current[keys[0]] < df[keys[0]].min()]
+        return pd.concat([df_current, df]).sort_values(keys)
+    msk = df_current.set_index(keys).index.isin(df.set_index(keys).index)
+    return pd.concat([df, df_current[~msk]]).sort_values(keys)
+
+
+@contextmanager
+def atomic_open(path: str, mode: str = "w", **kwargs):
+    """Open file for writing, so that readers never see it half-written.
+
+    Data is written to a temporary file in the same directory, which replaces `path` (atomic rename) only if the
+    block exits without errors. Otherwise, `path` is left untouched.
+
+    Args:
+        path (str): Path of the file.
+        mode (str, optional): Writing mode ("w" or "wb"). Defaults to "w".
+        kwargs: Other arguments for `open` (e.g. `encoding`, `newline`).
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=folder, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+        # Keep permissions of the file being replaced (temporary files are only readable by the owner)
+        os.chmod(tmp, os.stat(path).st_mode if os.path.exists(path) else 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
@@ -1,5 +1,18 @@
-from .scraping import get_soup, get_driver, request_json
-from .download import read_xlsx_from_url
+import importlib
 
 
-__all__ = ["get_soup", "get_driver", "request_json", "read_xlsx_from_url"]
+# Imported on first access, so that e.g. `from cowidev.utils.web import sessions` does not load Selenium
+_EXPORTS = {
+    "get_soup": ".scraping",
+    "get_driver": ".scraping",
+    "pooled_driver": ".scraping",
+    "request_json": ".scraping",
+    "read_xlsx_from_url": ".download",
+}
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,265 @@
+"""On-disk HTTP response cache shared by all scrapers.
+
+Responses are stored content-addressed (by the SHA-256 of their body) under `blobs/`, and indexed by a key built from
+the request URL and parameters under `entries/`. Stale entries are revalidated with a conditional GET
+(`If-None-Match`/`If-Modified-Since`), so unchanged sources only cost a 304 round trip. The cache is bounded in size
+and evicts least-recently-used entries. All writes are atomic renames, so it can be shared across threads and
+processes.
+
+The cache is disabled by default. Enable it by setting environment variable `${OWID_COVID_HTTP_CACHE}` to the cache
+directory (optionally, `${OWID_COVID_HTTP_CACHE_TTL}` in seconds and `${OWID_COVID_HTTP_CACHE_SIZE}` in MB), or by
+calling `enable_cache`.
+"""
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+TTL = 300
+MAX_SIZE = 2 * 1024 ** 3
+CHUNK_SIZE = 1024 * 1024
+# Temporary files older than this (seconds) are leftovers of interrupted writes
+TMP_MAX_AGE = 3600
+_HEADERS_KEEP = ["Content-Type", "Content-Disposition", "ETag", "Last-Modified"]
+
+
+class HTTPCache:
+    """Content-addressed HTTP cache with conditional GET revalidation and LRU eviction.
+
+    Args:
+        path (str): Cache directory.
+        ttl (float, optional): Seconds during which a cached response is served without revalidation. Defaults to
+                                300.
+        max_size (int, optional): Maximum size of the cached bodies, in bytes. Defaults to 2 GB.
+    """
+
+    def __init__(self, path: str, ttl: float = TTL, max_size: int = MAX_SIZE):
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self._path_entries = os.path.join(path, "entries")
+        self._path_blobs = os.path.join(path, "blobs")
+        os.makedirs(self._path_entries, exist_ok=True)
+        os.makedirs(self._path_blobs, exist_ok=True)
+
+    @classmethod
+    def from_env(cls):
+        path = os.environ.get("OWID_COVID_HTTP_CACHE")
+        if not path:
+            return None
+        ttl = float(os.environ.get("OWID_COVID_HTTP_CACHE_TTL", TTL))
+        max_size = int(float(os.environ.get("OWID_COVID_HTTP_CACHE_SIZE", MAX_SIZE / 1024 ** 2)) * 1024 ** 2)
+        return cls(path, ttl=ttl, max_size=max_size)
+
+    def key(self, url: str, params=None) -> str:
+        if params:
+            url = f"{url}?{urlencode(sorted(dict(params).items()))}"
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def fetch(self, url: str, fetch, params=None, headers=None) -> dict:
+        """Get cache entry for `url`, downloading or revalidating it if needed.
+
+        Args:
+            url (str): Resource URL.
+            fetch (callable): Function performing the actual GET request. Called with the URL and keyword arguments
+                                `headers` and `stream`, returns a `requests.Response`.
+            params (dict, optional): Query parameters. Part of the cache key.
+            headers (dict, optional): Request headers.
+
+        Returns:
+            dict: Entry metadata. Body is available at `self.blob_path(entry)`.
+        """
+        key = self.key(url, params)
+        entry = self._load_entry(key)
+        if entry is not None and time.time() - entry["fetched_at"] < self.ttl:
+            self._touch(key)
+            return entry
+        headers = dict(headers or {})
+        if entry is not None:
+            headers.update(self._conditional_headers(entry))
+        response = fetch(url, headers=headers, stream=True)
+        if entry is not None and response.status_code == 304:
+            response.close()
+            entry["fetched_at"] = time.time()
+            self._save_entry(key, entry)
+            return entry
+        if not response.ok:
+            raise requests.HTTPError(f"Web {url} not found! {response.content}", response=response)
+        entry = self._store(key, response)
+        self._evict()
+        return entry
+
+    def blob_path(self, entry: dict) -> str:
+        return os.path.join(self._path_blobs, entry["digest"])
+
+    def to_response(self, entry: dict) -> requests.Response:
+        """Build a `requests.Response` from a cache entry."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = entry["url"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        with open(self.blob_path(entry), "rb") as f:
+            response._content = f.read()
+        return response
+
+    def clear(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+        os.makedirs(self._path_entries, exist_ok=True)
+        os.makedirs(self._path_blobs, exist_ok=True)
+
+    def _conditional_headers(self, entry):
+        headers = {}
+        if entry["headers"].get("ETag"):
+            headers["If-None-Match"] = entry["headers"]["ETag"]
+        if entry["headers"].get("Last-Modified"):
+            headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+        return headers
+
+    def _entry_path(self, key):
+        return os.path.join(self._path_entries, f"{key}.json")
+
+    def _load_entry(self, key):
+        try:
+            with open(self._entry_path(key)) as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if not os.path.isfile(self.blob_path(entry)):
+            return None
+        return entry
+
+    def _save_entry(self, key, entry):
+        with tempfile.NamedTemporaryFile("w", dir=self._path_entries, suffix=".tmp", delete=False) as tmp:
+            try:
+                json.dump(entry, tmp)
+                tmp.close()
+                os.replace(tmp.name, self._entry_path(key))
+            finally:
+                _remove(tmp.name)
+
+    def _touch(self, key):
+        try:
+            os.utime(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _store(self, key, response):
+        digest = hashlib.sha256()
+        size = 0
+        with tempfile.NamedTemporaryFile("wb", dir=self._path_blobs, suffix=".tmp", delete=False) as tmp:
+            try:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    digest.update(chunk)
+                    size += len(chunk)
+                    tmp.write(chunk)
+                tmp.close()
+                entry = {
+                    "url": response.url,
+                    "digest": digest.hexdigest(),
+                    "size": size,
+                    "headers": {k: response.headers[k] for k in _HEADERS_KEEP if k in response.headers},
+                    "fetched_at": time.time(),
+                }
+                os.replace(tmp.name, self.blob_path(entry))
+            finally:
+                _remove(tmp.name)
+        self._save_entry(key, entry)
+        return entry
+
+    def _evict(self):
+        with open(os.path.join(self.path, ".lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            self._drop_stale_tmp()
+            entries = self._scan_entries()
+            blobs = {e["digest"]: e["size"] for _, _, e in entries}
+            if sum(blobs.values()) <= self.max_size:
+                return
+            references = self._drop_lru(entries, sum(blobs.values()))
+            self._drop_unreferenced(references)
+
+    def _scan_entries(self):
+        """Get all entries, as tuples of last access time, path and entry."""
+        entries = []
+        for filename in os.listdir(self._path_entries):
+            if not filename.endswith(".json"):
+                continue
+            path = os.path.join(self._path_entries, filename)
+            try:
+                with open(path) as f:
+                    entries.append((os.path.getmtime(path), path, json.load(f)))
+            except (FileNotFoundError, json.JSONDecodeError):
+                continue
+        return entries
+
+    def _drop_lru(self, entries, size):
+        """Drop least recently used entries until the blobs they reference fit. Returns references left per blob."""
+        entries = sorted(entries, key=lambda x: x[0])
+        references = {}
+        for _, _, e in entries:
+            references[e["digest"]] = references.get(e["digest"], 0) + 1
+        for _, path, e in entries:
+            if size <= self.max_size:
+                break
+            os.remove(path)
+            references[e["digest"]] -= 1
+            if references[e["digest"]] == 0:
+                size -= e["size"]
+        return references
+
+    def _drop_unreferenced(self, references):
+        for digest in os.listdir(self._path_blobs):
+            if references.get(digest, 0) == 0 and not digest.endswith(".tmp"):
+                _remove(os.path.join(self._path_blobs, digest))
+
+    def _drop_stale_tmp(self):
+        """Drop temporary files left behind by writes of crashed processes."""
+        now = time.time()
+        for folder in (self._path_entries, self._path_blobs):
+            for filename in os.listdir(folder):
+                if not filename.endswith(".tmp"):
+                    continue
+                path = os.path.join(folder, filename)
+                try:
+                    if now - os.path.getmtime(path) > TMP_MAX_AGE:
+                        os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+_CACHE = HTTPCache.from_env()
+
+
+def get_cache():
+    """Get the process-wide HTTP cache, or None if it is disabled."""
+    return _CACHE
+
+
+def enable_cache(path: str, ttl: float = TTL, max_size: int = MAX_SIZE) -> HTTPCache:
+    """Enable the process-wide HTTP cache."""
+    global _CACHE
+    _CACHE = HTTPCache(path, ttl=ttl, max_size=max_size)
+    return _CACHE
+
+
+def disable_cache():
+    """Disable the process-wide HTTP cache."""
+    global _CACHE
+    _CACHE = None
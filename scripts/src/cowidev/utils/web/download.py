@@ -1,7 +1,11 @@
-import requests
+import shutil
 import tempfile
 import pandas as pd
 
+from cowidev.utils.web import sessions
+from cowidev.utils.web.cache import get_cache
+from cowidev.utils.web.prefetch import get_prefetched
+
 
 def read_xlsx_from_url(url: str, timeout=30, as_series: bool = False, drop=False, **kwargs) -> pd.DataFrame:
     """Download and load xls file from URL.
@@ -33,8 +37,18 @@ def read_csv_from_url(url, timeout=30, **kwargs):
     return df
 
 
-def download_file_from_url(url, save_path, chunk_size=1024 * 1024, timeout=30):
-    r = requests.get(url, stream=True, timeout=timeout)
+def download_file_from_url(url, save_path, chunk_size=1024 * 1024, timeout=30, use_cache=True):
+    response = get_prefetched(url)
+    if response is not None:
+        with open(save_path, "wb") as fd:
+            fd.write(response.content)
+        return
+    cache = get_cache()
+    if use_cache and cache is not None:
+        entry = cache.fetch(url, lambda url, **kw: sessions.request("get", url, timeout=timeout, **kw))
+        shutil.copyfile(cache.blob_path(entry), save_path)
+        return
+    r = sessions.request("get", url, stream=True, timeout=timeout)
     with open(save_path, "wb") as fd:
         for chunk in r.iter_content(chunk_size=chunk_size):
             fd.write(chunk)
@@ -0,0 +1,134 @@
+"""Asyncio-based prefetching of source URLs.
+
+Downloads many URLs concurrently on a single event loop (with a limit of concurrent requests per host) and keeps the
+responses in memory. `get_response` and `download_file_from_url` then serve plain GET requests for a prefetched URL
+from memory, so the synchronous scraping code of each module runs against the prefetched bytes.
+"""
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlparse
+
+import aiohttp
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+MAX_PER_HOST = 4
+MAX_TOTAL = 200
+MAX_SIZE = 50 * 1024 ** 2
+TIMEOUT = 30
+# Body is stored decoded
+_HEADERS_DROP = ["content-encoding", "content-length", "transfer-encoding"]
+
+_LOCK = threading.Lock()
+_STORE = {}
+
+
+def prefetch(
+    urls: list,
+    headers: dict = None,
+    max_per_host: int = MAX_PER_HOST,
+    max_total: int = MAX_TOTAL,
+    timeout: float = TIMEOUT,
+) -> dict:
+    """Download `urls` concurrently and keep successful responses in memory.
+
+    Failed requests (errors, non-2xx responses or bodies larger than 50 MB) are not stored, so the modules requesting
+    them fall back to a regular request.
+
+    Args:
+        urls (list): URLs to download.
+        headers (dict, optional): Request headers. Defaults to None.
+        max_per_host (int, optional): Maximum concurrent requests per host. Defaults to 4.
+        max_total (int, optional): Maximum concurrent requests overall. Defaults to 200.
+        timeout (float, optional): Timeout per request, in seconds. Defaults to 30.
+
+    Returns:
+        dict: Summary with number of URLs requested, stored, failed, and time spent (seconds).
+    """
+    t0 = time.time()
+    urls = list(dict.fromkeys(urls))
+    headers_request = dict(headers or {})
+    # Only encodings decoded by aiohttp out of the box
+    headers = {**headers_request, "Accept-Encoding": "gzip, deflate"}
+    results = asyncio.run(_prefetch(urls, headers, max_per_host, max_total, timeout))
+    stored = {url: {**r, "headers_request": headers_request} for url, r in zip(urls, results) if r is not None}
+    with _LOCK:
+        _STORE.update(stored)
+    return {
+        "requested": len(urls),
+        "stored": len(stored),
+        "failed": len(urls) - len(stored),
+        "time (sec)": round(time.time() - t0, 2),
+    }
+
+
+def get_prefetched(url: str, headers: dict = None, verify: bool = True) -> requests.Response:
+    """Get prefetched response for `url` as a `requests.Response`, or None if it was not prefetched.
+
+    The prefetched response is only served if the request would be the same as the one used to prefetch it.
+
+    Args:
+        url (str): Resource URL.
+        headers (dict, optional): Request headers. Defaults to None (any headers, e.g. when the caller does not set
+                                    them).
+        verify (bool, optional): Whether the request verifies TLS certificates (prefetching always does). Defaults to
+                                    True.
+    """
+    with _LOCK:
+        entry = _STORE.get(url)
+    if entry is None or verify is not True:
+        return None
+    if headers is not None and dict(headers) != entry["headers_request"]:
+        return None
+    response = requests.Response()
+    response.status_code = entry["status"]
+    response.reason = "OK"
+    response.url = entry["url"]
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = entry["content"]
+    return response
+
+
+def clear():
+    """Drop all prefetched responses."""
+    with _LOCK:
+        _STORE.clear()
+
+
+async def _prefetch(urls, headers, max_per_host, max_total, timeout):
+    semaphores = defaultdict(lambda: asyncio.Semaphore(max_per_host))
+    connector = aiohttp.TCPConnector(limit=max_total, limit_per_host=max_per_host)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    ) as session:
+        return await asyncio.gather(*[_fetch(session, semaphores[urlparse(url).netloc], url) for url in urls])
+
+
+async def _fetch(session, semaphore, url):
+    async with semaphore:
+        try:
+            async with session.get(url) as response:
+                if response.status >= 300 or (response.content_length or 0) > MAX_SIZE:
+                    return None
+                chunks = []
+                size = 0
+                async for chunk in response.content.iter_chunked(1024 * 1024):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size > MAX_SIZE:
+                        return None
+                return {
+                    "status": response.status,
+                    "url": str(response.url),
+                    "headers": {k: v for k, v in response.headers.items() if k.lower() not in _HEADERS_DROP},
+                    "content": b"".join(chunks),
+                }
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            return None
@@ -1,11 +1,26 @@
+from contextlib import contextmanager
+import glob
 import json
-from urllib.error import HTTPError
+from multiprocessing.util import Finalize
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
 
 from bs4 import BeautifulSoup
 import requests
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.options import Options as ChroOpt
 from selenium.webdriver.firefox.options import Options as FireOpt
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from cowidev.utils.web import sessions
+from cowidev.utils.web.prefetch import get_prefetched
+from cowidev.utils.web.cache import get_cache
 
 
 def get_headers() -> dict:
@@ -28,22 +43,36 @@ def get_headers() -> dict:
 def get_response(
     source: str,
     request_method: str = "get",
+    use_cache: bool = True,
     **kwargs,
 ):
     kwargs["headers"] = kwargs.get("headers", get_headers())
     kwargs["verify"] = kwargs.get("verify", True)
     kwargs["timeout"] = kwargs.get("timeout", 20)
+    if request_method == "get" and not kwargs.get("params"):
+        response = get_prefetched(source, headers=kwargs["headers"], verify=kwargs["verify"])
+        if response is not None:
+            return response
+    cache = get_cache()
+    if use_cache and cache is not None and request_method == "get" and not kwargs.get("stream"):
+        params = kwargs.pop("params", None)
+        headers = kwargs.pop("headers")
+        entry = cache.fetch(
+            source,
+            lambda url, **kw: sessions.request("get", url, params=params, **kwargs, **kw),
+            params,
+            headers=headers,
+        )
+        return cache.to_response(entry)
     try:
-        if request_method == "get":
-            response = requests.get(source, **kwargs)
-        elif request_method == "post":
-            response = requests.post(source, **kwargs)
+        if request_method in ["get", "post"]:
+            response = sessions.request(request_method, source, **kwargs)
         else:
             raise ValueError(f"Invalid value for `request_method`: {request_method}. Use 'get' or 'post'")
     except Exception as err:
         raise err
     if not response.ok:
-        raise HTTPError(f"Web {source} not found! {response.content}")
+        raise requests.HTTPError(f"Web {source} not found! {response.content}", response=response)
     return response
 
 
@@ -174,3 +203,206 @@ def scroll_till_element(driver, element):
     )
     scroll_y_by = desired_y - current_y
     driver.execute_script("window.scrollBy(0, arguments[0]);", scroll_y_by)
+
+
+class BrowserPool:
+    """Bounded pool of warm headless Chrome drivers.
+
+    Drivers are started on demand (up to `size`) and reused across callers. Each checkout gets an isolated context:
+    cookies, storage and extra windows from the previous user are cleared, and downloads go to a folder of its own.
+
+    Args:
+        size (int, optional): Maximum number of drivers. Defaults to 2.
+        headless (bool, optional): Run drivers in headless mode. Defaults to True.
+    """
+
+    def __init__(self, size: int = 2, headless: bool = True):
+        self.size = size
+        self.headless = headless
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._pid = os.getpid()
+
+    @contextmanager
+    def driver(self, download_folder: str = None):
+        """Check out a driver.
+
+        Args:
+            download_folder (str, optional): Folder where files downloaded are saved. Defaults to a new temporary
+                                                folder, removed when the driver is returned to the pool.
+        """
+        self._slots.acquire()
+        driver = None
+        folder_tmp = None
+        try:
+            driver = self._checkout()
+            if download_folder is None:
+                download_folder = folder_tmp = tempfile.mkdtemp(prefix="cowid-")
+            set_download_settings(driver, download_folder)
+            yield driver
+        finally:
+            if driver is not None:
+                self._checkin(driver)
+            if folder_tmp is not None:
+                shutil.rmtree(folder_tmp, ignore_errors=True)
+            self._slots.release()
+
+    def close(self):
+        """Quit all idle drivers."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            _quit(driver)
+
+    def _checkout(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return get_driver(headless=self.headless)
+            if _is_alive(driver):
+                return driver
+            _quit(driver)
+
+    def _checkin(self, driver):
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.implicitly_wait(0)
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            driver.get("about:blank")
+        except WebDriverException:
+            _quit(driver)
+        else:
+            self._idle.put(driver)
+
+
+def _is_alive(driver) -> bool:
+    try:
+        driver.current_url
+    except WebDriverException:
+        return False
+    return True
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except WebDriverException:
+        pass
+
+
+_BROWSER_POOL = None
+_BROWSER_POOL_LOCK = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get the process-wide browser pool.
+
+    Its size is set by environment variable `${OWID_COVID_BROWSER_POOL_SIZE}` (defaults to 2). Forked processes get a
+    pool of their own.
+    """
+    global _BROWSER_POOL
+    with _BROWSER_POOL_LOCK:
+        if _BROWSER_POOL is None or _BROWSER_POOL._pid != os.getpid():
+            _BROWSER_POOL = BrowserPool(size=int(os.environ.get("OWID_COVID_BROWSER_POOL_SIZE", 2)))
+            # Closed at exit, also in processes forked by multiprocessing (these exit through `os._exit`, which skips
+            # `atexit` hooks)
+            Finalize(None, _BROWSER_POOL.close, exitpriority=10)
+        return _BROWSER_POOL
+
+
+def pooled_driver(download_folder: str = None):
+    """Check out a headless Chrome driver from the process-wide browser pool.
+
+    Use as a context manager, in place of `get_driver`:
+
+        with pooled_driver() as driver:
+            driver.get(url)
+    """
+    return get_browser_pool().driver(download_folder)
+
+
+def close_browser_pool():
+    """Quit all drivers in the process-wide browser pool."""
+    with _BROWSER_POOL_LOCK:
+        if _BROWSER_POOL is not None:
+            _BROWSER_POOL.close()
+
+
+def wait_for_element(driver, by: str, value: str, timeout: float = 30, clickable: bool = False):
+    """Wait until an element is present (or clickable) and return it.
+
+    Args:
+        driver: Selenium driver.
+        by (str): Locator strategy (see `selenium.webdriver.common.by.By`).
+        value (str): Locator value.
+        timeout (float, optional): Maximum seconds to wait. Defaults to 30.
+        clickable (bool, optional): Wait until the element is visible and enabled. Defaults to False.
+    """
+    if clickable:
+        condition = EC.element_to_be_clickable((by, value))
+    else:
+        condition = EC.presence_of_element_located((by, value))
+    return WebDriverWait(driver, timeout).until(condition)
+
+
+def wait_for_elements(driver, by: str, value: str, timeout: float = 30, condition=None) -> list:
+    """Wait until at least one element is present and return all matching elements.
+
+    Args:
+        condition (callable, optional): Extra condition on the list of elements found. Defaults to None.
+    """
+
+    def _ready(driver):
+        elems = driver.find_elements(by, value)
+        if elems and (condition is None or condition(elems)):
+            return elems
+        return False
+
+    return WebDriverWait(driver, timeout).until(_ready)
+
+
+def wait_for_stable_text(driver, by: str, value: str, timeout: float = 30, interval: float = 0.5) -> str:
+    """Wait until an element's text is non-empty and no longer changing (e.g. animated counters), and return it."""
+    last = None
+
+    def _ready(driver):
+        nonlocal last
+        text = driver.find_element(by, value).text
+        if text and text == last:
+            return text
+        last = text
+        return False
+
+    return WebDriverWait(driver, timeout, poll_frequency=interval).until(_ready)
+
+
+def wait_for_windows(driver, n: int, timeout: float = 30):
+    """Wait until the driver has `n` windows open."""
+    WebDriverWait(driver, timeout).until(EC.number_of_windows_to_be(n))
+    return driver.window_handles
+
+
+def wait_for_download(folder: str, extension: str = "*", timeout: float = 60, interval: float = 0.5) -> str:
+    """Wait until a download in `folder` completes and return the path to the newest file.
+
+    Args:
+        folder (str): Download folder.
+        extension (str, optional): Extension of the expected file (e.g. 'csv'). Defaults to any.
+        timeout (float, optional): Maximum seconds to wait. Defaults to 60.
+    """
+    t0 = time.time()
+    while time.time() - t0 < timeout:
+        if not glob.glob(os.path.join(folder, "*.crdownload")):
+            files = glob.glob(os.path.join(folder, f"*.{extension}"))
+            if files:
+                return max(files, key=os.path.getctime)
+        time.sleep(interval)
+    raise TimeoutError(f"No file with extension {extension} downloaded in {folder} after {timeout} seconds")
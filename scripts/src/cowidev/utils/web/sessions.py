@@ -0,0 +1,131 @@
+"""Process-wide registry of persistent HTTP sessions.
+
+One `requests.Session` is kept per host, so consecutive requests to the same host reuse TCP/TLS connections
+(keep-alive). Connection errors and 5xx responses are retried inline with exponential backoff. Per-host statistics are
+available via `session_stats`.
+"""
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+RETRIES = 3
+BACKOFF_FACTOR = 0.5
+STATUS_FORCELIST = [500, 502, 503, 504]
+POOL_MAXSIZE = 16
+
+
+class SessionRegistry:
+    """Per-host `requests.Session` registry with retries and statistics.
+
+    Args:
+        retries (int, optional): Maximum number of retries on connection errors and 5xx responses. Defaults to 3.
+        backoff_factor (float, optional): Retries wait `backoff_factor * 2 ** (retry - 1)` seconds. Defaults to 0.5.
+        pool_maxsize (int, optional): Maximum number of connections kept alive per host. Defaults to 16.
+    """
+
+    def __init__(
+        self, retries: int = RETRIES, backoff_factor: float = BACKOFF_FACTOR, pool_maxsize: int = POOL_MAXSIZE
+    ):
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.pool_maxsize = pool_maxsize
+        self._sessions = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def session(self, url: str) -> requests.Session:
+        """Get session for the host of `url`."""
+        host = urlparse(url).netloc
+        with self._lock:
+            self._check_pid()
+            if host not in self._sessions:
+                self._sessions[host] = self._new_session()
+            return self._sessions[host]
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send request through the session of the host of `url`, and record its statistics."""
+        host = urlparse(url).netloc
+        t0 = time.time()
+        try:
+            response = self.session(url).request(method, url, **kwargs)
+        except Exception:
+            self._record(host, t0, error=True)
+            raise
+        retries = getattr(response.raw, "retries", None)
+        self._record(
+            host,
+            t0,
+            error=not response.ok and response.status_code != 304,
+            retries=len(retries.history) if retries is not None else 0,
+            size=0 if kwargs.get("stream") else len(response.content),
+        )
+        return response
+
+    def stats(self) -> pd.DataFrame:
+        """Get per-host statistics: number of requests, errors and retries, total time and bytes downloaded."""
+        with self._lock:
+            stats = [{"host": host, **v} for host, v in self._stats.items()]
+        if not stats:
+            return pd.DataFrame(columns=["requests", "errors", "retries", "time (sec)", "bytes"])
+        return pd.DataFrame(stats).set_index("host").sort_values("time (sec)", ascending=False)
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+
+    def _new_session(self):
+        retry = Retry(
+            total=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=STATUS_FORCELIST,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=self.pool_maxsize)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _check_pid(self):
+        # Connections must not be shared with forked processes
+        if self._pid != os.getpid():
+            self._sessions = {}
+            self._stats = {}
+            self._pid = os.getpid()
+
+    def _record(self, host, t0, error=False, retries=0, size=0):
+        with self._lock:
+            s = self._stats.setdefault(host, {"requests": 0, "errors": 0, "retries": 0, "time (sec)": 0, "bytes": 0})
+            s["requests"] += 1
+            s["errors"] += int(error)
+            s["retries"] += retries
+            s["time (sec)"] = round(s["time (sec)"] + time.time() - t0, 2)
+            s["bytes"] += size
+
+
+_REGISTRY = SessionRegistry()
+
+
+def get_session(url: str) -> requests.Session:
+    """Get the process-wide persistent session for the host of `url`."""
+    return _REGISTRY.session(url)
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """Send request through the process-wide session registry (keep-alive, retries on transient errors)."""
+    return _REGISTRY.request(method, url, **kwargs)
+
+
+def session_stats() -> pd.DataFrame:
+    """Get per-host request statistics for this process."""
+    return _REGISTRY.stats()
@@ -0,0 +1,83 @@
+"""In-run, single-flight fetch layer.
+
+Several modules read the same large files (e.g. WHO vaccination data). When they request the same resource
+concurrently, only the first request downloads and parses it; the others wait for it and get the same object. Results
+are kept in memory until `clear` is called.
+
+Shared DataFrames are read-only: their underlying arrays are flagged as non-writeable, so callers must not modify them
+in place (use `assign`, `rename`, filtering, etc., or `copy` explicitly).
+"""
+import threading
+
+import pandas as pd
+
+from cowidev.utils.web.download import read_csv_from_url
+
+
+_LOCK = threading.Lock()
+_RESULTS = {}
+_INFLIGHT = {}
+
+
+def get_shared(key, loader):
+    """Get object identified by `key`, calling `loader` only if no other caller has done (or is doing) so.
+
+    Args:
+        key (hashable): Resource identifier.
+        loader (callable): Function without arguments returning the resource.
+
+    Returns:
+        object: Resource.
+    """
+    with _LOCK:
+        if key in _RESULTS:
+            return _RESULTS[key]
+        flight = _INFLIGHT.get(key)
+        leader = flight is None
+        if leader:
+            flight = _INFLIGHT[key] = {"event": threading.Event(), "error": None}
+    if not leader:
+        flight["event"].wait()
+        if flight["error"] is not None:
+            raise flight["error"]
+        return _RESULTS[key]
+    try:
+        value = loader()
+        with _LOCK:
+            _RESULTS[key] = value
+        return value
+    except Exception as err:
+        flight["error"] = err
+        raise
+    finally:
+        with _LOCK:
+            _INFLIGHT.pop(key)
+        flight["event"].set()
+
+
+def read_csv_shared(url: str, **kwargs) -> pd.DataFrame:
+    """Read CSV from `url`, sharing the download and the parsed DataFrame with other callers in the run.
+
+    Args:
+        url (str): File url.
+        kwargs: Arguments for `cowidev.utils.web.download.read_csv_from_url`. Part of the resource identifier, so
+                callers sharing a file should read it with the same arguments and select columns afterwards.
+
+    Returns:
+        pandas.DataFrame: Read-only data.
+    """
+    key = ("csv", url, tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+    return get_shared(key, lambda: _freeze(read_csv_from_url(url, **kwargs)))
+
+
+def clear():
+    """Drop all shared resources."""
+    with _LOCK:
+        _RESULTS.clear()
+
+
+def _freeze(df: pd.DataFrame) -> pd.DataFrame:
+    for arr in df._mgr.arrays:
+        if hasattr(arr, "flags"):
+            arr.flags.writeable = False
+    return df
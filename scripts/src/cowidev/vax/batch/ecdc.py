@@ -6,7 +6,7 @@ from cowidev.utils import paths
 from cowidev.utils.clean.dates import clean_date, localdate
 from cowidev.utils.utils import check_known_columns
 from cowidev.utils.web.download import read_csv_from_url
-from cowidev.vax.utils.files import export_metadata_manufacturer, export_metadata_age
+from cowidev.vax.utils.files import export_metadata_manufacturer, export_metadata_age, export_locations
 from cowidev.vax.utils.orgs import ECDC_VACCINES
 
 
@@ -226,12 +226,10 @@ class ECDC:
 
         Validity is defined as a country having all age groups defined by `AGE_GROUPS_MUST_HAVE`.
         """
-        locations = df.location.unique()
-        locations_valid = []
-        for location in locations:
-            df_c = df.loc[df.location == location]
-            if not AGE_GROUPS_MUST_HAVE.difference(df_c.age_group.unique()):
-                locations_valid.append(location)
+        age_groups = df.groupby("location", sort=False).age_group.unique()
+        locations_valid = [
+            location for location, groups in age_groups.items() if not AGE_GROUPS_MUST_HAVE.difference(groups)
+        ]
         locations_valid = [loc for loc in locations_valid if loc not in LOCATIONS_AGE_EXCLUDED]
         df = df[df.location.isin(locations_valid)]
         return df
@@ -333,22 +331,20 @@ class ECDC:
     def export_age(self, df: pd.DataFrame):
         df_age = df.pipe(self.pipeline_age)
         # Export
-        locations = df_age.location.unique()
-        for location in locations:
-            df_c = df_age[df_age.location == location].pipe(self._filter_age_targetgroup)
-            df_c.to_csv(
-                paths.out_vax(location, age=True),
-                columns=[
-                    "location",
-                    "date",
-                    "age_group_min",
-                    "age_group_max",
-                    "people_vaccinated_per_hundred",
-                    "people_fully_vaccinated_per_hundred",
-                    "people_with_booster_per_hundred",
-                ],
-                index=False,
-            )
+        export_locations(
+            df_age,
+            columns=[
+                "location",
+                "date",
+                "age_group_min",
+                "age_group_max",
+                "people_vaccinated_per_hundred",
+                "people_fully_vaccinated_per_hundred",
+                "people_with_booster_per_hundred",
+            ],
+            transform=self._filter_age_targetgroup,
+            age=True,
+        )
         export_metadata_age(
             df=df,
             source_name="European Centre for Disease Prevention and Control (ECDC)",
@@ -358,14 +354,11 @@ class ECDC:
     def export_manufacturer(self, df: pd.DataFrame):
         df_manufacturer = df.pipe(self.pipeline_manufacturer)
         # Export
-        locations = df_manufacturer.location.unique()
-        for location in locations:
-            df_c = df_manufacturer[df_manufacturer.location == location]
-            df_c.to_csv(
-                paths.out_vax(location, manufacturer=True),
-                columns=["location", "date", "vaccine", "total_vaccinations"],
-                index=False,
-            )
+        export_locations(
+            df_manufacturer,
+            columns=["location", "date", "vaccine", "total_vaccinations"],
+            manufacturer=True,
+        )
         export_metadata_manufacturer(
             df=df_manufacturer,
             source_name="European Centre for Disease Prevention and Control (ECDC)",
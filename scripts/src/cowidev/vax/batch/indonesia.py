@@ -5,6 +5,8 @@ import pandas as pd
 from cowidev.vax.utils.utils import build_vaccine_timeline
 from cowidev.vax.utils.base import CountryVaxBase
 from cowidev.vax.utils.files import load_data
+from cowidev.vax.utils.orgs import WHO_VACCINATION_DATA_URL
+from cowidev.utils.web.singleflight import read_csv_shared
 
 
 class Indonesia(CountryVaxBase):
@@ -59,10 +61,9 @@ class Indonesia(CountryVaxBase):
         return df
 
     def pipe_add_latest_who(self, df: pd.DataFrame) -> pd.DataFrame:
-        who = pd.read_csv(
-            "https://covid19.who.int/who-data/vaccination-data.csv",
-            usecols=["COUNTRY", "DATA_SOURCE", "DATE_UPDATED", "PERSONS_FULLY_VACCINATED"],
-        )
+        who = read_csv_shared(WHO_VACCINATION_DATA_URL)[
+            ["COUNTRY", "DATA_SOURCE", "DATE_UPDATED", "PERSONS_FULLY_VACCINATED"]
+        ]
 
         who = who[(who.COUNTRY == self.location) & (who.DATA_SOURCE == "REPORTING")]
         if len(who) == 0:
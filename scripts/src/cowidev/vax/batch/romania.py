@@ -3,8 +3,10 @@ import pandas as pd
 from cowidev.utils import paths
 from cowidev.utils.utils import check_known_columns
 from cowidev.utils.web import request_json
+from cowidev.utils.web.singleflight import read_csv_shared
 from cowidev.vax.utils.files import export_metadata_manufacturer
 from cowidev.vax.utils.utils import make_monotonic
+from cowidev.vax.utils.orgs import WHO_VACCINATION_DATA_URL
 
 
 class Romania:
@@ -96,10 +98,9 @@ class Romania:
         return df
 
     def pipe_add_latest_who(self, df: pd.DataFrame) -> pd.DataFrame:
-        who = pd.read_csv(
-            "https://covid19.who.int/who-data/vaccination-data.csv",
-            usecols=["COUNTRY", "DATA_SOURCE", "DATE_UPDATED", "PERSONS_VACCINATED_1PLUS_DOSE"],
-        )
+        who = read_csv_shared(WHO_VACCINATION_DATA_URL)[
+            ["COUNTRY", "DATA_SOURCE", "DATE_UPDATED", "PERSONS_VACCINATED_1PLUS_DOSE"]
+        ]
 
         who = who[(who.COUNTRY == "Romania") & (who.DATA_SOURCE == "REPORTING")]
         if len(who) == 0:
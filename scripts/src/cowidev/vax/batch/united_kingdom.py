@@ -4,7 +4,7 @@ import pandas as pd
 from uk_covid19 import Cov19API
 
 from cowidev.vax.utils.utils import make_monotonic
-from cowidev.utils import paths
+from cowidev.vax.utils.files import export_locations
 
 
 class UnitedKingdom:
@@ -76,13 +76,9 @@ class UnitedKingdom:
             .dropna(subset=["total_vaccinations"])
         )
 
-    def _filter_location(self, df: pd.DataFrame, location: str) -> pd.DataFrame:
-        return df[df.location == location].assign(location=location)
-
     def to_csv(self):
         df = self.read().pipe(self.pipeline)
-        for location in set(df.location):
-            df.pipe(self._filter_location, location).pipe(make_monotonic).to_csv(paths.out_vax(location), index=False)
+        export_locations(df, transform=make_monotonic)
 
 
 def main():
@@ -22,6 +22,11 @@ def main():
             modules_name=cfg.countries,
             skip_countries=cfg.skip_countries,
             gsheets_api=config.gsheets_api,
+            backend=cfg.backend,
+            timeout=cfg.timeout,
+            max_memory=cfg.max_memory,
+            n_jobs_selenium=cfg.njobs_selenium,
+            prefetch_sources=cfg.prefetch,
         )
     if "process" in config.mode:
         cfg = config.ProcessDataConfig()
@@ -31,12 +36,16 @@ def main():
             skip_complete=cfg.skip_complete,
             skip_monotonic=cfg.skip_monotonic_check,
             skip_anomaly=cfg.skip_anomaly_check,
+            incremental=cfg.incremental,
+            parallel=cfg.parallel,
+            n_jobs=cfg.njobs,
         )
     if "generate" in config.mode:
         if config.check_r:
             test_check_with_r()
         else:
-            main_generate_dataset()
+            cfg = config.GenerateDatasetConfig()
+            main_generate_dataset(incremental=cfg.incremental, verify=cfg.verify_incremental)
     if "export" in config.mode:
         main_export(url=creds.owid_cloud_table_post)
     if "propose" in config.mode:
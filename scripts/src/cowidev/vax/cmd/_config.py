@@ -44,9 +44,21 @@ class ConfigParams(object):
         display,
         credentials_file,
         check_r=False,
+        backend="threading",
+        timeout=None,
+        max_memory=None,
+        njobs_selenium=None,
+        prefetch=False,
+        incremental=False,
     ):
         self._parallel = parallel
         self._njobs = njobs
+        self._backend = backend
+        self._timeout = timeout
+        self._max_memory = max_memory
+        self._njobs_selenium = njobs_selenium
+        self._prefetch = prefetch
+        self._incremental = incremental
         self._countries = countries
         self.mode = mode
         self.display = display
@@ -73,6 +85,12 @@ class ConfigParams(object):
             display=args.show_config,
             credentials_file=args.credentials,
             check_r=args.checkr,
+            backend=args.backend,
+            timeout=args.timeout,
+            max_memory=args.max_memory,
+            njobs_selenium=args.njobs_selenium,
+            prefetch=args.prefetch,
+            incremental=args.incremental,
         )
 
     @property
@@ -138,6 +156,11 @@ class ConfigParams(object):
                         self._return_value_pipeline("get-data", "skip_countries", []),
                     )
                 ),
+                "backend": self._return_value_pipeline("get-data", "backend", self._backend),
+                "timeout": self._return_value_pipeline("get-data", "timeout", self._timeout),
+                "max_memory": self._return_value_pipeline("get-data", "max_memory", self._max_memory),
+                "njobs_selenium": self._return_value_pipeline("get-data", "njobs_selenium", self._njobs_selenium),
+                "prefetch": self._return_value_pipeline("get-data", "prefetch", self._prefetch),
             }
         )
 
@@ -166,6 +189,18 @@ class ConfigParams(object):
                 "skip_complete": self._return_value_pipeline("process-data", "skip_complete", []),
                 "skip_monotonic_check": self._get_skip_check("skip_monotonic_check"),
                 "skip_anomaly_check": self._get_skip_check("skip_anomaly_check"),
+                "incremental": self._return_value_pipeline("process-data", "incremental", self._incremental),
+                "parallel": self._return_value_pipeline("process-data", "parallel", self._parallel),
+                "njobs": self._return_value_pipeline("process-data", "njobs", self._njobs),
+            }
+        )
+
+    def GenerateDatasetConfig(self):
+        """Use `_token`/`id`/`secret` for variables that are secret"""
+        return ConfigParamsStep(
+            {
+                "incremental": self._return_value_pipeline("generate-dataset", "incremental", self._incremental),
+                "verify_incremental": self._return_value_pipeline("generate-dataset", "verify_incremental", False),
             }
         )
 
@@ -239,6 +274,8 @@ class ConfigParams(object):
             s += f"Get Data: \n{self.GetDataConfig().__str__()}"
         if "process" in self.mode:
             s += f"Process Data: \n{self.ProcessDataConfig().__str__()}"
+        if "generate" in self.mode:
+            s += f"Generate Dataset: \n{self.GenerateDatasetConfig().__str__()}"
         s += "\n*************************\n\n"
         # s += f"Secrets: \n{self.CredentialsConfig().__str__()}"
         return s
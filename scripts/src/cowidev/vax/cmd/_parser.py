@@ -27,6 +27,13 @@ def choice_check(x):
     return x
 
 
+def positive_int(x):
+    x = int(x)
+    if x < 1:
+        raise argparse.ArgumentTypeError(f"Must be a positive integer, found {x}")
+    return x
+
+
 def _parse_args():
     parser = argparse.ArgumentParser(
         description="Execute COVID-19 vaccination data collection pipeline.",
@@ -53,14 +60,15 @@ def _parse_args():
         help=(
             "Run for a specific country. For a list of countries use commas to separate them (only in mode get-data)"
             "E.g.: peru, norway. \nSpecial keywords: 'all' to run all countries, 'incremental' to run incremental"
-            "updates, 'batch' to run batch updates, 'who' for WHO-sourced countries, 'spc' for SPC-sourced countries. Defaults to all countries."
+            "updates, 'batch' to run batch updates, 'who' for WHO-sourced countries, 'spc' for SPC-sourced countries."
+            " Defaults to all countries."
         ),
     )
     parser.add_argument(
         "-p",
         "--parallel",
         action="store_true",
-        help="Execution done in parallel (only in mode get-data).",
+        help="Execution done in parallel (only in modes get-data and process-data).",
     )
     parser.add_argument(
         "-j",
@@ -68,9 +76,56 @@ def _parse_args():
         default=-2,
         help=(
             "Number of jobs for parallel processing. Check Parallel class in joblib library for more info  (only in "
-            "mode get-data)."
+            "modes get-data and process-data)."
+        ),
+    )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help=(
+            "Download the source URLs of all non-Selenium modules concurrently before running them (only in mode "
+            "get-data)."
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Only process locations whose data or check configuration changed since the last run, reuse the "
+            "previous output for the rest (only in modes process-data and generate-dataset)."
         ),
     )
+    parser.add_argument(
+        "--njobs-selenium",
+        default=None,
+        type=positive_int,
+        help=(
+            "Maximum number of Selenium-based modules running at the same time (only in mode get-data). Defaults to "
+            "no limit other than `--njobs`."
+        ),
+    )
+    parser.add_argument(
+        "-b",
+        "--backend",
+        default="threading",
+        choices=["threading", "process"],
+        help=(
+            "Parallel backend (only in mode get-data). 'process' runs each module in its own worker process, which "
+            "is killed if it exceeds `--timeout` or `--max-memory`."
+        ),
+    )
+    parser.add_argument(
+        "--timeout",
+        default=None,
+        type=float,
+        help="Maximum execution time per module, in seconds (only in mode get-data with backend 'process').",
+    )
+    parser.add_argument(
+        "--max-memory",
+        default=None,
+        type=float,
+        help="Maximum memory per module, in MB (only in mode get-data with backend 'process').",
+    )
     parser.add_argument(
         "-s",
         "--show-config",
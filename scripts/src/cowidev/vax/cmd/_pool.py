@@ -0,0 +1,303 @@
+import ast
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures, FIRST_COMPLETED
+import heapq
+import importlib.util
+import multiprocessing as mp
+from multiprocessing.connection import wait
+import re
+import statistics
+import time
+
+from joblib import effective_n_jobs
+import psutil
+
+from cowidev.vax.cmd.utils import get_logger
+
+
+logger = get_logger()
+
+STATUS_TIMEOUT = "timeout"
+STATUS_MEMORY = "memory"
+STATUS_KILLED = "killed"
+
+SELENIUM = "selenium"
+HTTP = "http"
+_SOURCE_URL_NAMES = {"source_url", "source"}
+_SELENIUM_REGEX = re.compile(r"\b(selenium|get_driver|pooled_driver)\b")
+
+
+def _worker(func, module_name, conn):
+    try:
+        result = func(module_name)
+    except BaseException as err:
+        result = {"module_name": module_name, "success": False, "skipped": False, "time": None, "status": "failed"}
+        logger.error(f"VAX - {module_name}: ❌ {err}", exc_info=True)
+    conn.send(result)
+    conn.close()
+
+
+def _process_tree(pid):
+    try:
+        proc = psutil.Process(pid)
+        return [proc] + proc.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return []
+
+
+def _memory_mb(pid):
+    rss = 0
+    for proc in _process_tree(pid):
+        try:
+            rss += proc.memory_info().rss
+        except psutil.NoSuchProcess:
+            pass
+    return rss / 1024 ** 2
+
+
+def _kill_tree(pid):
+    procs = _process_tree(pid)
+    for proc in procs:
+        try:
+            proc.kill()
+        except psutil.NoSuchProcess:
+            pass
+    psutil.wait_procs(procs, timeout=5)
+
+
+def module_source(module_name: str) -> str:
+    """Get source code of a module without importing it."""
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or spec.origin is None:
+        return ""
+    with open(spec.origin, encoding="utf-8") as f:
+        return f.read()
+
+
+def module_source_urls(module_name: str) -> list:
+    """Get source URLs declared by a module, without importing it.
+
+    These are string literals starting with 'http' that are assigned to a variable or attribute named `source_url` or
+    `source` (e.g. `self.source_url = "https://..."`), or passed as keyword arguments with those names.
+    """
+    urls = []
+    try:
+        tree = ast.parse(module_source(module_name))
+    except SyntaxError:
+        return urls
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign):
+            names = [_target_name(t) for t in node.targets]
+        elif isinstance(node, ast.AnnAssign):
+            names = [_target_name(node.target)]
+        elif isinstance(node, ast.keyword):
+            names = [node.arg]
+        else:
+            continue
+        if _SOURCE_URL_NAMES.intersection(names) and _is_url(node.value):
+            urls.append(node.value.value)
+    return urls
+
+
+def _target_name(target):
+    if isinstance(target, ast.Name):
+        return target.id
+    if isinstance(target, ast.Attribute):
+        return target.attr
+    return None
+
+
+def _is_url(node):
+    return isinstance(node, ast.Constant) and isinstance(node.value, str) and node.value.startswith("http")
+
+
+def module_kind(module_name: str) -> str:
+    """Guess whether a module drives a browser (Selenium) or only does plain HTTP requests."""
+    if _SELENIUM_REGEX.search(module_source(module_name)):
+        return SELENIUM
+    return HTTP
+
+
+class ModuleScheduler:
+    """Longest-processing-time-first scheduler for country modules.
+
+    Modules are dispatched in decreasing order of expected execution time, subject to a global limit of `n_jobs`
+    concurrent modules and a separate limit for Selenium-based modules. Dispatch decisions are taken whenever a
+    worker becomes free, so a module that runs faster or slower than expected shifts the rest of the plan.
+
+    Args:
+        modules_name (list): Modules to run.
+        modules_time (dict): Expected execution time (seconds) per module, usually from the last recorded run.
+                                Modules without history are assigned the median time.
+        n_jobs (int): Maximum number of concurrent modules. Negative values follow joblib's convention.
+        n_jobs_selenium (int, optional): Maximum number of concurrent Selenium modules (at least 1). Defaults to None
+                                            (only bounded by `n_jobs`).
+    """
+
+    def __init__(self, modules_name: list, modules_time: dict, n_jobs: int = 1, n_jobs_selenium: int = None):
+        if n_jobs_selenium is not None and n_jobs_selenium < 1:
+            raise ValueError(f"`n_jobs_selenium` must be a positive integer, found {n_jobs_selenium}")
+        self.n_jobs = effective_n_jobs(n_jobs)
+        self.limits = {
+            SELENIUM: min(n_jobs_selenium or self.n_jobs, self.n_jobs),
+            HTTP: self.n_jobs,
+        }
+        self.has_history = any(m in modules_time for m in modules_name)
+        default = statistics.median(modules_time.values()) if modules_time else 0
+        self.modules_time = {m: modules_time.get(m, default) for m in modules_name}
+        self.modules_kind = {m: module_kind(m) for m in modules_name}
+        self.modules_name = sorted(modules_name, key=lambda m: -self.modules_time[m])
+        self._pending = list(self.modules_name)
+
+    def __len__(self):
+        return len(self._pending)
+
+    def next(self, running: list):
+        """Pop the next module to dispatch, given the modules currently running.
+
+        Returns None if no pending module can be started without exceeding a concurrency limit.
+        """
+        if len(running) >= self.n_jobs:
+            return None
+        module_name = self._pick(self._pending, running)
+        if module_name is not None:
+            self._pending.remove(module_name)
+        return module_name
+
+    def _pick(self, pending, running):
+        counts = {SELENIUM: 0, HTTP: 0}
+        for m in running:
+            counts[self.modules_kind[m]] += 1
+        for m in pending:
+            kind = self.modules_kind[m]
+            if counts[kind] < self.limits[kind]:
+                return m
+        return None
+
+    def predict(self) -> float:
+        """Simulate the schedule with the expected execution times and return the predicted makespan (seconds).
+
+        Returns None if there is no timing history for any of the modules.
+        """
+        if not self.has_history:
+            return None
+        pending = list(self.modules_name)
+        running = []
+        t = 0
+        while pending or running:
+            while len(running) < self.n_jobs:
+                module_name = self._pick(pending, [m for _, m in running])
+                if module_name is None:
+                    break
+                pending.remove(module_name)
+                heapq.heappush(running, (t + self.modules_time[module_name], module_name))
+            t, _ = heapq.heappop(running)
+        return round(t, 2)
+
+
+class ModuleThreadPool:
+    """Run country modules on a thread pool, dispatching them as decided by a `ModuleScheduler`.
+
+    Args:
+        func (callable): Function run in the worker. Takes a module name and returns its execution result dictionary.
+    """
+
+    def __init__(self, func):
+        self.func = func
+
+    def run(self, scheduler: ModuleScheduler) -> list:
+        running = {}
+        results = {}
+        with ThreadPoolExecutor(max_workers=scheduler.n_jobs) as executor:
+            while len(scheduler) or running:
+                module_name = scheduler.next(list(running.values()))
+                while module_name is not None:
+                    running[executor.submit(self.func, module_name)] = module_name
+                    module_name = scheduler.next(list(running.values()))
+                done, _ = wait_futures(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+        return [results[m] for m in scheduler.modules_name]
+
+
+class ModuleProcessPool:
+    """Run country modules in isolated worker processes.
+
+    Each module runs in its own forked process, so a hung scraper or a runaway parse can be killed without taking
+    down the rest of the run. Browser processes spawned by a module are killed along with it. Modules are dispatched
+    as decided by a `ModuleScheduler`.
+
+    Args:
+        func (callable): Function run in the worker. Takes a module name and returns its execution result dictionary.
+        timeout (float, optional): Wall-clock limit per module, in seconds. Defaults to None (no limit).
+        max_memory (float, optional): Resident memory limit per module (including child processes), in MB.
+                                        Defaults to None (no limit).
+        poll_interval (float, optional): Seconds between timeout and memory checks. Defaults to 1.
+    """
+
+    def __init__(self, func, timeout: float = None, max_memory: float = None, poll_interval=1):
+        self.func = func
+        self.timeout = timeout
+        self.max_memory = max_memory
+        self.poll_interval = poll_interval
+        self._ctx = mp.get_context("fork")
+
+    def run(self, scheduler: ModuleScheduler) -> list:
+        running = {}
+        results = {}
+        while len(scheduler) or running:
+            module_name = scheduler.next(list(running))
+            while module_name is not None:
+                running[module_name] = self._start(module_name)
+                module_name = scheduler.next(list(running))
+            self._wait(running)
+            for module_name in list(running):
+                result = self._check(module_name, *running[module_name])
+                if result is not None:
+                    results[module_name] = result
+                    running.pop(module_name)
+        return [results[m] for m in scheduler.modules_name]
+
+    def _start(self, module_name):
+        conn_recv, conn_send = self._ctx.Pipe(duplex=False)
+        proc = self._ctx.Process(target=_worker, args=(self.func, module_name, conn_send), daemon=False)
+        proc.start()
+        conn_send.close()
+        return proc, conn_recv, time.time()
+
+    def _wait(self, running):
+        objects = [conn for _, conn, _ in running.values()] + [proc.sentinel for proc, _, _ in running.values()]
+        wait(objects, timeout=self.poll_interval)
+
+    def _check(self, module_name, proc, conn, t0):
+        if conn.poll():
+            try:
+                result = conn.recv()
+            except EOFError:
+                result = None
+            else:
+                proc.join()
+                conn.close()
+                return result
+        t = round(time.time() - t0, 2)
+        if not proc.is_alive():
+            proc.join()
+            conn.close()
+            logger.error(f"VAX - {module_name}: ❌ worker died (exit code {proc.exitcode})")
+            return self._result(module_name, t, STATUS_KILLED)
+        if self.timeout is not None and t > self.timeout:
+            self._terminate(proc, conn)
+            logger.error(f"VAX - {module_name}: ❌ timed out after {self.timeout} seconds")
+            return self._result(module_name, t, STATUS_TIMEOUT)
+        if self.max_memory is not None and _memory_mb(proc.pid) > self.max_memory:
+            self._terminate(proc, conn)
+            logger.error(f"VAX - {module_name}: ❌ exceeded memory limit of {self.max_memory} MB")
+            return self._result(module_name, t, STATUS_MEMORY)
+        return None
+
+    def _terminate(self, proc, conn):
+        _kill_tree(proc.pid)
+        proc.join()
+        conn.close()
+
+    def _result(self, module_name, t, status):
+        return {"module_name": module_name, "success": False, "skipped": False, "time": t, "status": status}
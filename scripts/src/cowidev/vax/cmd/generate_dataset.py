@@ -1,24 +1,43 @@
 import os
-import itertools
 from datetime import datetime
 from collections import ChainMap
-from math import isnan
 import glob
-import json
+import hashlib
 import locale
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing as mp
 from shutil import copyfile
+from typing import Iterable
 
+import numpy as np
 import pandas as pd
 from pandas.api.types import is_numeric_dtype
 
 from cowidev.utils import paths
-from cowidev.utils.utils import pd_series_diff_values
+from cowidev.utils.utils import pd_series_diff_values, atomic_open
 from cowidev.utils.clean import clean_date
+from cowidev.utils.columnar import export_intermediate, read_intermediate
+from cowidev.utils.json_stream import write_json_array
 from cowidev.vax.cmd.utils import get_logger
 from cowidev.vax.utils.checks import VACCINES_ACCEPTED
 
 
 logger = get_logger()
+# Bump whenever the vaccinations table pipeline changes its output, so that incremental builds start from scratch
+STATE_VERSION = 1
+
+
+def _export_csv(df: pd.DataFrame, path: str, path_columnar: str = None) -> float:
+    """Export DataFrame to CSV atomically (and to a columnar copy, if given), return time spent (seconds)."""
+    t0 = time.time()
+    if path_columnar is not None:
+        export_intermediate(df, path, path_columnar)
+    else:
+        with atomic_open(path, "w", encoding="utf-8", newline="") as f:
+            df.to_csv(f, index=False)
+    return round(time.time() - t0, 2)
 
 
 class Bucket(object):
@@ -28,11 +47,26 @@ class Bucket(object):
 
 
 class DatasetGenerator:
-    def __init__(self, inputs, outputs):
+    def __init__(
+        self,
+        inputs,
+        outputs,
+        compact_json: bool = False,
+        incremental: bool = False,
+        verify: bool = False,
+        state_path: str = None,
+        export_workers: int = None,
+    ):
         # Inputs
         self.inputs = inputs
         # Outputs
         self.outputs = outputs
+        self.compact_json = compact_json
+        self.export_workers = export_workers
+        # Incremental build
+        self.incremental = incremental
+        self.verify = verify
+        self.state_path = state_path or paths.SCRIPTS.TMP_VAX_GENERATE_STATE
         # Others
         self.aggregates = self.build_aggregates()
         self._countries_covered = None
@@ -147,53 +181,67 @@ class DatasetGenerator:
             ]
         ]
 
-    def _get_aggregate(self, df, agg_name, included_locs, excluded_locs):
-        # Take rows that matter
-        agg = df[~df.location.isin(self.aggregates.keys())]  # remove aggregated rows
-        if excluded_locs is not None:
-            agg = agg[~agg.location.isin(excluded_locs)]
-        elif included_locs is not None:
-            agg = agg[agg.location.isin(included_locs)]
-
-        # Get full location-date grid
-        agg = (
-            pd.DataFrame(
-                itertools.product(agg.location.unique(), agg.date.unique()),
-                columns=[agg.location.name, agg.date.name],
-            )
-            .merge(agg, on=["date", "location"], how="outer")
-            .sort_values(by=["location", "date"])
-        )
+    def _aggregates_membership(self, locations: pd.Index) -> pd.DataFrame:
+        """Get membership of `locations` in each aggregate, as a boolean matrix (aggregate x location)."""
+        return pd.DataFrame(
+            {
+                agg_name: (
+                    ~locations.isin(agg["excluded_locs"])
+                    if agg["excluded_locs"] is not None
+                    else locations.isin(agg["included_locs"])
+                    if agg["included_locs"] is not None
+                    else np.ones(len(locations), dtype=bool)
+                )
+                for agg_name, agg in self.aggregates.items()
+            },
+            index=locations,
+        ).T
 
-        # NaN: Forward filling + Zero-filling if all metric is NaN
+    def _get_aggregates(self, df, agg_names: list = None):
         cols = [
             "total_vaccinations",
             "people_vaccinated",
             "people_fully_vaccinated",
             "total_boosters",
         ]
-        grouper = agg.groupby("location")
+        # Take rows that matter
+        df = df[~df.location.isin(self.aggregates.keys())]  # remove aggregated rows
+        locations = pd.Index(df.location.unique()).sort_values()
+        dates = pd.DatetimeIndex(df.date.unique()).sort_values()
+
+        # Aggregate membership matrix (aggregate x location)
+        membership = self._aggregates_membership(locations)
+        if agg_names is not None:
+            membership = membership.loc[agg_names]
+        membership = membership.astype(float)
+
+        # Dates reported by at least one location of each aggregate
+        reported = df.assign(reported=1.0).pivot(index="location", columns="date", values="reported")
+        reported = reported.reindex(index=locations, columns=dates).fillna(0)
+        msk = (membership.values @ reported.values > 0) & (dates.date < datetime.now().date())
+
+        # Full location-date grid (location x date) per metric
+        # NaN: Forward filling + Zero-filling if all metric is NaN
+        data = {}
         for col in cols:
-            agg[col] = grouper[col].apply(lambda x: x.fillna(0) if x.isnull().all() else x.fillna(method="ffill"))
-
-        # Aggregate
-        agg = agg.groupby("date").sum().reset_index().assign(location=agg_name)
-        agg = agg[agg.date.dt.date < datetime.now().date()]
-        return agg
+            x = df.pivot(index="location", columns="date", values=col).reindex(index=locations, columns=dates)
+            x = x.astype(float).ffill(axis=1)
+            x.loc[x.isnull().all(axis=1)] = 0
+            # Aggregate
+            data[col] = membership.values @ x.fillna(0).values
+
+        idx_agg, idx_date = np.nonzero(msk)
+        return pd.DataFrame(
+            {
+                "date": dates[idx_date],
+                **{col: data[col][idx_agg, idx_date] for col in cols},
+                "location": membership.index[idx_agg],
+            }
+        )
 
     def pipe_aggregates(self, df: pd.DataFrame) -> pd.DataFrame:
         logger.info(f"Building aggregate regions {list(self.aggregates.keys())}")
-        aggs = []
-        for agg_name, _ in self.aggregates.items():
-            aggs.append(
-                self._get_aggregate(
-                    df=df,
-                    agg_name=agg_name,
-                    included_locs=self.aggregates[agg_name]["included_locs"],
-                    excluded_locs=self.aggregates[agg_name]["excluded_locs"],
-                )
-            )
-        return pd.concat([df] + aggs, ignore_index=True)
+        return pd.concat([df, self._get_aggregates(df)], ignore_index=True)
 
     def pipe_daily(self, df: pd.DataFrame) -> pd.DataFrame:
         logger.info("Adding daily metrics")
@@ -203,61 +251,46 @@ class DatasetGenerator:
         df = df.sort_values(["location", "date"])
         return df
 
-    def _add_smoothed(self, df: pd.DataFrame) -> pd.DataFrame:
-        # NEW VACCINATIONS
-        # Range where total_vaccinations is registered
-        dt_min = df.dropna(subset=["total_vaccinations"]).date.min()
-        dt_max = df.dropna(subset=["total_vaccinations"]).date.max()
-        df_nan = df[(df.date < dt_min) | (df.date > dt_max)]
-
-        # Add missing dates
-        df = df.merge(
-            pd.Series(pd.date_range(dt_min, dt_max), name="date"),
-            how="right",
-        ).sort_values(by="date")
-
-        # Calculate and add smoothed vars
-        df["new_vaccinations_smoothed"] = (
-            df.total_vaccinations.interpolate(method="linear")
-            .diff()
-            .rolling(7, min_periods=1)
-            .mean()
-            .apply(lambda x: round(x) if not isnan(x) else x)
+    def _daily_grid(self, df: pd.DataFrame, metric: str) -> pd.DataFrame:
+        """Get all dates between the first and last values of `metric`, for each location."""
+        dt = df.dropna(subset=[metric]).groupby("location").date.agg(["min", "max"])
+        n = (dt["max"] - dt["min"]).dt.days.values + 1
+        offset = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+        return pd.DataFrame(
+            {
+                "location": np.repeat(dt.index.values, n),
+                "date": np.repeat(dt["min"].values, n) + pd.to_timedelta(offset, unit="D"),
+            }
         )
 
-        # Add missing dates
-        df = pd.concat([df, df_nan], ignore_index=True).sort_values("date")
-        df.loc[:, "location"] = df.location.dropna().iloc[0]
-
-        # PEOPLE_VACCINATED
-        # Range where people_vaccinated is registered
-        dt_min = df.dropna(subset=["people_vaccinated"]).date.min()
-        dt_max = df.dropna(subset=["people_vaccinated"]).date.max()
-        df_nan = df[(df.date < dt_min) | (df.date > dt_max)]
-
-        # Add missing dates
-        df = df.merge(
-            pd.Series(pd.date_range(dt_min, dt_max), name="date"),
-            how="right",
-        ).sort_values(by="date")
-
-        # Calculate and add smoothed vars
-        df["new_people_vaccinated_smoothed"] = (
-            df.people_vaccinated.interpolate(method="linear")
-            .diff()
-            .rolling(7, min_periods=1)
-            .mean()
-            .apply(lambda x: round(x) if not isnan(x) else x)
-        )
-
-        # Add missing dates
-        df = pd.concat([df, df_nan], ignore_index=True).sort_values("date")
-        df.loc[:, "location"] = df.location.dropna().iloc[0]
-        return df
+    def _add_smoothed(self, df: pd.DataFrame, metric: str, metric_smoothed: str) -> pd.DataFrame:
+        # Range where metric is registered, with missing dates
+        grid = self._daily_grid(df, metric)
+        grid = grid.merge(df[["location", "date", metric]], on=["location", "date"], how="left")
+        # Calculate smoothed var. First and last values of each location are not NaN, so interpolation never crosses
+        # locations
+        x = grid[metric].interpolate(method="linear").diff()
+        x = x.where(grid.location == grid.location.shift())
+        x = x.groupby(grid.location).rolling(7, min_periods=1).mean()
+        return grid[["location", "date"]].assign(**{metric_smoothed: np.round(x.values)})
 
     def pipe_smoothed(self, df: pd.DataFrame) -> pd.DataFrame:
         logger.info("Adding smoothed variables")
-        return df.groupby("location").apply(self._add_smoothed).reset_index(drop=True)
+        smoothed = [
+            self._add_smoothed(df, "total_vaccinations", "new_vaccinations_smoothed"),
+            self._add_smoothed(df, "people_vaccinated", "new_people_vaccinated_smoothed"),
+        ]
+        # Add missing dates
+        keys = (
+            pd.concat([df[["location", "date"]]] + [x[["location", "date"]] for x in smoothed], ignore_index=True)
+            .drop_duplicates()
+            .sort_values(by=["location", "date"])
+        )
+        df_smoothed = keys.merge(df, on=["location", "date"], how="left")
+        for x in smoothed:
+            df_smoothed = df_smoothed.merge(x, on=["location", "date"], how="left")
+        columns = list(df.columns) + ["new_vaccinations_smoothed", "new_people_vaccinated_smoothed"]
+        return df_smoothed[columns].reset_index(drop=True)
 
     def get_population(self, df_subnational: pd.DataFrame) -> pd.DataFrame:
         # Build population dataframe
@@ -273,6 +306,10 @@ class DatasetGenerator:
 
         return pop
 
+    def _get_countries_covered(self, locations, df_subnational: pd.DataFrame) -> list:
+        ncountries = df_subnational.location.tolist() + list(self.aggregates.keys())
+        return list(filter(lambda x: x not in ncountries, locations))
+
     def pipe_capita(self, df: pd.DataFrame) -> pd.DataFrame:
         logger.info("Adding per-capita variables")
         # Get data
@@ -284,9 +321,7 @@ class DatasetGenerator:
             raise ValueError(f"Missing population data for {missing_locs}")
 
         # Get covered countries
-        locations = df.location.unique()
-        ncountries = df_subnational.location.tolist() + list(self.aggregates.keys())
-        self._countries_covered = list(filter(lambda x: x not in ncountries, locations))
+        self._countries_covered = self._get_countries_covered(df.location.unique(), df_subnational)
         # Obtain per-capita metrics
         df = df.assign(
             total_vaccinations_per_hundred=(df.total_vaccinations * 100 / df.population).round(2),
@@ -349,6 +384,111 @@ class DatasetGenerator:
             .sort_values(by=["location", "date"])
         )
 
+    def _state_key(self) -> str:
+        """Hash of everything the vaccinations table depends on, other than the vaccination data itself."""
+        h = hashlib.sha256(f"{STATE_VERSION}".encode())
+        for path in [
+            self.inputs.population,
+            self.inputs.population_sub,
+            self.inputs.continent_countries,
+            self.inputs.eu_countries,
+            self.inputs.income_groups,
+            self.inputs.income_groups_compl,
+        ]:
+            with open(path, "rb") as f:
+                h.update(f.read())
+        return h.hexdigest()
+
+    def _location_hashes(self, df: pd.DataFrame) -> dict:
+        """Hash of the vaccination data of each location."""
+        df = df.sort_values(by=["location", "date"])
+        rows = pd.util.hash_pandas_object(df, index=False).values
+        return {
+            location: hashlib.sha256(rows[idx].tobytes()).hexdigest()
+            for location, idx in df.reset_index(drop=True).groupby("location").indices.items()
+        }
+
+    def _load_state(self):
+        try:
+            return pd.read_pickle(self.state_path)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+
+    def _save_state(self, state: dict):
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        with atomic_open(self.state_path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _changed_aggregates(self, locations_changed: set, locations: list, df: pd.DataFrame, state: dict) -> list:
+        # Aggregates are cut at the current date. If it changed and data reaches it, all of them may change
+        today = datetime.now().date()
+        if state["today"] != today and df.date.max().date() >= state["today"]:
+            return list(self.aggregates.keys())
+        if not locations_changed:
+            return []
+        membership = self._aggregates_membership(pd.Index(sorted(locations)))
+        return membership.index[membership[sorted(locations_changed)].any(axis=1)].tolist()
+
+    def pipeline_vaccinations_incremental(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Build vaccinations table, only recomputing locations (and aggregates) whose data changed since last run.
+
+        Locations are independent from each other, except for aggregates, which are recomputed if any of their
+        member locations changed. The table and hashes of the data of each location are kept in `self.state_path`.
+        If the state is missing or was built from different population or aggregate definitions, the table is built
+        from scratch.
+        """
+        df = df[
+            [
+                "date",
+                "location",
+                "total_vaccinations",
+                "people_vaccinated",
+                "people_fully_vaccinated",
+                "total_boosters",
+            ]
+        ]
+        key = self._state_key()
+        hashes = self._location_hashes(df)
+        state = self._load_state()
+        if state is None or state["key"] != key:
+            logger.info("No valid state from last run, building all locations")
+            df_base = self.pipeline_vaccinations(df)
+        else:
+            hashes_last = state["hashes"]
+            locations = set(hashes) | set(hashes_last)
+            locations_changed = {loc for loc in locations if hashes.get(loc) != hashes_last.get(loc)}
+            aggs_changed = self._changed_aggregates(locations_changed, locations, df, state)
+            logger.info(f"Rebuilding locations {sorted(locations_changed)} and aggregates {aggs_changed}")
+            df_base = state["df"]
+            df_base = df_base[~df_base.location.isin(locations_changed | set(aggs_changed))]
+            df_new = df[df.location.isin(locations_changed)]
+            if aggs_changed:
+                df_new = pd.concat([df_new, self._get_aggregates(df, aggs_changed)], ignore_index=True)
+            if not df_new.empty:
+                df_new = (
+                    df_new.pipe(self.pipe_daily)
+                    .pipe(self.pipe_smoothed)
+                    .pipe(self.pipe_capita)
+                    .pipe(self.pipe_vax_checks)
+                    .pipe(self.pipe_to_int)
+                )
+                df_base = pd.concat([df_base, df_new], ignore_index=True)
+            df_base = df_base.sort_values(by=["location", "date"]).reset_index(drop=True)
+            df_subnational = pd.read_csv(self.inputs.population_sub, usecols=["location"])
+            self._countries_covered = self._get_countries_covered(df_base.location.unique(), df_subnational)
+        if self.verify:
+            self._verify_vaccinations(df, df_base)
+        self._save_state({"key": key, "today": datetime.now().date(), "hashes": hashes, "df": df_base})
+        return df_base
+
+    def _verify_vaccinations(self, df: pd.DataFrame, df_base: pd.DataFrame):
+        logger.info("Verifying incremental build against full build")
+        df_full = self.pipeline_vaccinations(df).reset_index(drop=True)
+        try:
+            pd.testing.assert_frame_equal(df_base, df_full[df_base.columns], check_dtype=False, check_exact=True)
+        except AssertionError as err:
+            raise ValueError(f"Incremental build of vaccinations table differs from full build!\n{err}")
+
     def pipe_vaccinations_csv(self, df: pd.DataFrame, df_iso: pd.DataFrame) -> pd.DataFrame:
         return df.merge(df_iso, on="location").rename(
             columns={
@@ -379,23 +519,21 @@ class DatasetGenerator:
             ]
         ]
 
-    def pipe_vaccinations_json(self, df: pd.DataFrame) -> list:
-        location_iso_codes = df[["location", "iso_code"]].drop_duplicates().values.tolist()
+    def pipe_vaccinations_json(self, df: pd.DataFrame):
+        """Build the objects of `vaccinations.json`, one location at a time (generator)."""
         metrics = [column for column in df.columns if column not in {"location", "iso_code"}]
         df = df.assign(date=df.date.apply(clean_date))
-        return [
-            {
+        for (location, iso_code), df_loc in df.groupby(["location", "iso_code"], sort=False):
+            values = df_loc[metrics].astype(object).values
+            msk = df_loc[metrics].notnull().values
+            yield {
                 "country": location,
                 "iso_code": iso_code,
                 "data": [
-                    {**x[i]}
-                    for i, x in df.loc[(df.location == location) & (df.iso_code == iso_code), metrics]
-                    .stack()
-                    .groupby(level=0)
+                    {metric: value for metric, value, m in zip(metrics, row, row_msk) if m}
+                    for row, row_msk in zip(values, msk)
                 ],
             }
-            for location, iso_code in location_iso_codes
-        ]
 
     def pipe_manufacturer_select_cols(self, df: pd.DataFrame) -> pd.DataFrame:
         return df[
@@ -655,7 +793,7 @@ class DatasetGenerator:
         df_vaccinations: pd.DataFrame,
         df_manufacturer: pd.DataFrame,
         df_age: pd.DataFrame,
-        json_vaccinations: dict,
+        json_vaccinations: Iterable,
         df_grapher: pd.DataFrame,
         df_manufacturer_grapher: pd.DataFrame,
         df_age_grapher: pd.DataFrame,
@@ -674,28 +812,48 @@ class DatasetGenerator:
             (df_age_grapher, self.outputs.grapher_age),
             (html_table, self.outputs.html_table),
         ]
-        for obj, path in files:
-            if path.endswith(".csv"):
-                obj.to_csv(path, index=False)
-            elif path.endswith(".json"):
-                with open(path, "w") as f:
-                    json.dump(obj, f, indent=2)  # default=lambda o: o.__dict__, sort_keys=True
-            elif path.endswith(".html"):
-                with open(path, "w") as f:
-                    f.write(obj)
-            else:
+        for _, path in files:
+            if not path.endswith((".csv", ".json", ".html")):
                 raise ValueError("Format not supported. Currently only csv, json and html are accepted!")
+        # Vaccinations table is read by the megafile step, from its columnar copy
+        columnar = {self.outputs.vaccinations: getattr(self.outputs, "vaccinations_columnar", None)}
+        # Files are independent: CSVs are serialized on a pool of worker processes, while this process writes the rest
+        with ProcessPoolExecutor(max_workers=self.export_workers, mp_context=mp.get_context("fork")) as executor:
+            futures = {
+                path: executor.submit(_export_csv, obj, path, columnar.get(path))
+                for obj, path in files
+                if path.endswith(".csv")
+            }
+            for obj, path in files:
+                if path.endswith(".json"):
+                    self._export_file(obj, path, lambda f, obj: write_json_array(obj, f, compact=self.compact_json))
+                elif path.endswith(".html"):
+                    self._export_file(obj, path, lambda f, obj: f.write(obj))
+            for path, future in futures.items():
+                logger.info(f"Exported {os.path.basename(path)} ({future.result()} sec)")
+
+    def _export_file(self, obj, path: str, write):
+        t0 = time.time()
+        with atomic_open(path, "w") as f:
+            write(f, obj)
+        logger.info(f"Exported {os.path.basename(path)} ({round(time.time() - t0, 2)} sec)")
 
     def _cp_locations_files(self):
         copyfile(paths.SCRIPTS.OUTPUT_VAX_META_MANUFACT, paths.DATA.VAX_META_MANUFACT)
         copyfile(paths.SCRIPTS.OUTPUT_VAX_META_AGE, paths.DATA.VAX_META_AGE)
 
+    def _read_vaccinations(self) -> pd.DataFrame:
+        df = read_intermediate(self.inputs.vaccinations, self.inputs.vaccinations_columnar, parse_dates=["date"])
+        # Nullable integers (columnar copy) as parsed from the CSV: float if there are NaNs, int otherwise. Nullable
+        # arrays cannot be interpolated on pandas 1.3
+        return df.astype({col: float if df[col].hasnans else "int64" for col in df.select_dtypes("Int64").columns})
+
     def run(self):
         print("-- Generating dataset... --")
         logger.info("1/10 Loading input data...")
         try:
             df_metadata = pd.read_csv(self.inputs.metadata)
-            df_vaccinations = pd.read_csv(self.inputs.vaccinations, parse_dates=["date"])
+            df_vaccinations = self._read_vaccinations()
         except FileNotFoundError:
             raise FileNotFoundError(
                 "Internal files not found! Make sure to run `proccess-data` step prior to running `generate-dataset`."
@@ -720,7 +878,10 @@ class DatasetGenerator:
 
         # Vaccinations
         logger.info("4/10 Generating `vaccinations` table...")
-        df_vaccinations_base = df_vaccinations.pipe(self.pipeline_vaccinations)
+        if self.incremental:
+            df_vaccinations_base = df_vaccinations.pipe(self.pipeline_vaccinations_incremental)
+        else:
+            df_vaccinations_base = df_vaccinations.pipe(self.pipeline_vaccinations)
         df_vaccinations = df_vaccinations_base.pipe(self.pipe_vaccinations_csv, df_iso)
         logger.info("5/10 Generating `vaccinations` json...")
         json_vaccinations = df_vaccinations.pipe(self.pipe_vaccinations_json)
@@ -761,12 +922,13 @@ class DatasetGenerator:
         self._cp_locations_files()
 
 
-def main_generate_dataset():
+def main_generate_dataset(compact_json: bool = False, incremental: bool = False, verify: bool = False):
     # Select columns
     # TODO: Paths might better defined in vax.utils.paths.Paths
     inputs = Bucket(
         project_dir=paths.PROJECT_DIR,
         vaccinations=os.path.join(str(paths.SCRIPTS), "vaccinations.preliminary.csv"),
+        vaccinations_columnar=paths.SCRIPTS.TMP_VAX_COLUMNAR,
         metadata=os.path.join(str(paths.SCRIPTS), "metadata.preliminary.csv"),
         iso=os.path.join(paths.SCRIPTS.INPUT_ISO, "iso3166_1_alpha_3_codes.csv"),
         population=os.path.join(paths.SCRIPTS.INPUT_UN, "population_latest.csv"),
@@ -785,6 +947,7 @@ def main_generate_dataset():
         locations=os.path.join(paths.DATA.VACCINATIONS, "locations.csv"),
         automated=os.path.abspath(os.path.join(paths.SCRIPTS.OUTPUT_VAX, "automation_state.csv")),
         vaccinations=os.path.abspath(os.path.join(paths.DATA.VACCINATIONS, "vaccinations.csv")),
+        vaccinations_columnar=paths.SCRIPTS.TMP_VAX_DATASET_COLUMNAR,
         vaccinations_json=(os.path.abspath(os.path.join(paths.DATA.VACCINATIONS, "vaccinations.json"))),
         manufacturer=(
             os.path.abspath(
@@ -817,7 +980,7 @@ def main_generate_dataset():
         ),
         html_table=os.path.abspath(os.path.join(paths.SCRIPTS.OUTPUT_VAX, "source_table.html")),
     )
-    generator = DatasetGenerator(inputs, outputs)
+    generator = DatasetGenerator(inputs, outputs, compact_json=compact_json, incremental=incremental, verify=verify)
     generator.run()
 
     # Export timestamp
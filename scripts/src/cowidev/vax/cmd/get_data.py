@@ -1,14 +1,25 @@
 import time
 import importlib
 
-from joblib import Parallel, delayed
 import pandas as pd
 
+from cowidev.vax.cmd._pool import (
+    SELENIUM,
+    ModuleProcessPool,
+    ModuleScheduler,
+    ModuleThreadPool,
+    module_source,
+    module_source_urls,
+)
 from cowidev.vax.batch import __all__ as batch_countries
 from cowidev.vax.incremental import __all__ as incremental_countries
 from cowidev.utils.log import get_logger, print_eoe, system_details
 from cowidev.utils.s3 import obj_from_s3, obj_to_s3
 from cowidev.utils.clean.dates import localdate
+from cowidev.utils.web import prefetch, singleflight
+from cowidev.utils.web.scraping import close_browser_pool, get_headers
+from cowidev.utils.web.sessions import session_stats
+from cowidev.vax.utils.orgs import WHO_VACCINATION_DATA_URL
 
 
 # Logger
@@ -30,6 +41,14 @@ LOG_MACHINES = "s3://covid-19/log/machines.json"
 LOG_GET_COUNTRIES = "s3://covid-19/log/vax-get-data-countries.csv"
 LOG_GET_GLOBAL = "s3://covid-19/log/vax-get-data-global.csv"
 
+# Execution backends
+BACKENDS = ["threading", "process"]
+
+# Files read by several modules (constant name -> url)
+SHARED_SOURCES = {
+    "WHO_VACCINATION_DATA_URL": WHO_VACCINATION_DATA_URL,
+}
+
 
 class CountryDataGetter:
     def __init__(self, skip_countries: list, gsheets_api):
@@ -41,14 +60,13 @@ class CountryDataGetter:
         country = module_name.split(".")[-1]
         if country.lower() in self.skip_countries:
             logger.info(f"VAX - {module_name}: skipped! ⚠️")
-            return {"module_name": module_name, "success": None, "skipped": True, "time": None}
+            return {"module_name": module_name, "success": None, "skipped": True, "time": None, "status": "skipped"}
         args = []
         if country == "colombia":
             args.append(self.gsheets_api)
         logger.info(f"VAX - {module_name}: started")
         module = importlib.import_module(module_name)
         try:
-            # with time_limit(TIMEOUT):
             module.main(*args)
         except Exception as err:
             success = False
@@ -57,7 +75,8 @@ class CountryDataGetter:
             success = True
             logger.info(f"VAX - {module_name}: SUCCESS ✅")
         t = round(time.time() - t0, 2)
-        return {"module_name": module_name, "success": success, "skipped": False, "time": t}
+        status = "success" if success else "failed"
+        return {"module_name": module_name, "success": success, "skipped": False, "time": t, "status": status}
 
 
 def main_get_data(
@@ -66,49 +85,103 @@ def main_get_data(
     modules_name: list = MODULES_NAME,
     skip_countries: list = [],
     gsheets_api=None,
+    backend: str = "threading",
+    timeout: float = None,
+    max_memory: float = None,
+    n_jobs_selenium: int = None,
+    prefetch_sources: bool = False,
 ):
     """Get data from sources and export to output folder.
 
     Is equivalent to script `run_python_scripts.py`
+
+    Modules are scheduled longest-first based on their last recorded execution time, with at most `n_jobs_selenium`
+    Selenium-based modules running at the same time. With `backend="process"`, each module runs in its own worker
+    process, which is killed if it runs for longer than `timeout` seconds or uses more than `max_memory` MB.
+
+    With `prefetch_sources=True`, the source URLs declared by non-Selenium modules are downloaded concurrently before
+    running the modules, which then read them from memory.
     """
     t0 = time.time()
     print("-- Getting data... --")
+    if backend not in BACKENDS:
+        raise ValueError(f"Invalid value for `backend`: {backend}. Use one of {BACKENDS}")
     skip_countries = [x.lower() for x in skip_countries]
     country_data_getter = CountryDataGetter(skip_countries, gsheets_api)
-    modules_name = _load_modules_order(modules_name)
-    if parallel:
-        modules_execution_results = Parallel(n_jobs=n_jobs, backend="threading")(
-            delayed(country_data_getter.run)(
-                module_name,
-            )
-            for module_name in modules_name
-        )
-    else:
-        modules_execution_results = []
-        for module_name in modules_name:
-            modules_execution_results.append(
-                country_data_getter.run(
-                    module_name,
-                )
-            )
+    modules_time = _load_modules_time(modules_name)
+    modules_time.update({m: 0 for m in modules_name if m.split(".")[-1] in skip_countries})
+    scheduler = ModuleScheduler(modules_name, modules_time, n_jobs if parallel else 1, n_jobs_selenium)
+    t_sec_predicted = scheduler.predict()
+    if backend == "process":
+        _prefetch_shared_sources(modules_name)
+    if prefetch_sources:
+        _prefetch_source_urls(scheduler, skip_countries)
+    modules_execution_results = _run_modules(scheduler, country_data_getter, backend, timeout, max_memory)
     t_sec_1 = round(time.time() - t0, 2)
     # Get timing dataframe
     df_exec = _build_df_execution(modules_execution_results)
     # Retry failed modules
-    _retry_modules_failed(modules_execution_results, country_data_getter)
+    _retry_modules_failed(modules_execution_results, country_data_getter, backend, timeout, max_memory)
     # Print timing details
-    t_sec_1, t_min_1, t_sec_2, t_min_2 = _print_timing(t0, t_sec_1, df_exec)
+    t_sec_1, t_min_1, t_sec_2, t_min_2 = _print_timing(t0, t_sec_1, df_exec, t_sec_predicted)
+    if backend == "threading":
+        _print_host_stats()
     # Export log info
     _export_log_info(df_exec, t_sec_1, t_sec_2)
+    singleflight.clear()
+    prefetch.clear()
+    close_browser_pool()
 
     print_eoe()
 
 
+def _run_modules(scheduler, country_data_getter, backend, timeout, max_memory):
+    if backend == "process":
+        pool = ModuleProcessPool(country_data_getter.run, timeout=timeout, max_memory=max_memory)
+    else:
+        pool = ModuleThreadPool(country_data_getter.run)
+    return pool.run(scheduler)
+
+
+def _prefetch_shared_sources(modules_name):
+    """Load files read by several modules, so that worker processes inherit them instead of downloading them again.
+
+    With the thread backend this is not needed, as concurrent reads are already merged by `singleflight`.
+    """
+    for name, url in SHARED_SOURCES.items():
+        modules_using = [m for m in modules_name if name in module_source(m)]
+        if len(modules_using) < 2:
+            continue
+        logger.info(f"VAX - Prefetching {url} (used by {len(modules_using)} modules)")
+        try:
+            singleflight.read_csv_shared(url)
+        except Exception as err:
+            logger.warning(f"VAX - Could not prefetch {url}: {err}")
+
+
+def _prefetch_source_urls(scheduler, skip_countries):
+    """Download the source URLs declared by non-Selenium modules concurrently."""
+    urls = [
+        url
+        for m in scheduler.modules_name
+        if scheduler.modules_kind[m] != SELENIUM and m.split(".")[-1] not in skip_countries
+        for url in module_source_urls(m)
+    ]
+    logger.info(f"VAX - Prefetching {len(urls)} source URLs")
+    summary = prefetch.prefetch(urls, headers=get_headers())
+    logger.info(f"VAX - Prefetched {summary['stored']}/{summary['requested']} URLs in {summary['time (sec)']} seconds")
+
+
 def _build_df_execution(modules_execution_results):
     df_exec = (
         pd.DataFrame(
             [
-                {"module": m["module_name"], "execution_time (sec)": m["time"], "success": m["success"]}
+                {
+                    "module": m["module_name"],
+                    "execution_time (sec)": m["time"],
+                    "success": m["success"],
+                    "status": m["status"],
+                }
                 for m in modules_execution_results
             ]
         )
@@ -145,9 +218,10 @@ def _export_log_info(df_exec, t_sec_1, t_sec_2):
         obj_to_s3(df, LOG_GET_GLOBAL)
 
 
-def _load_modules_order(modules_name):
+def _load_modules_time(modules_name):
+    """Get last recorded execution time (seconds) for each module."""
     if len(modules_name) < 10:
-        return modules_name
+        return {}
     df = obj_from_s3(LOG_GET_COUNTRIES)
     # Filter by machine
     # details = system_details()
@@ -155,30 +229,38 @@ def _load_modules_order(modules_name):
     # if machine in df.machine:
     #     df = df[df.machine == machine]
     # df = pd.read_csv(os.path.join(paths.SCRIPTS.OUTPUT_VAX_LOG, "get-data.csv"))
-    module_order_all = (
+    df = (
         df.sort_values("date")
         .drop_duplicates(subset=["module"], keep="last")
-        .sort_values("execution_time (sec)", ascending=False)
-        .module.tolist()
+        .dropna(subset=["execution_time (sec)"])
     )
-    modules_name_order = [m for m in module_order_all if m in modules_name]
-    missing = [m for m in modules_name if m not in modules_name_order]
-    return modules_name_order + missing
+    df = df[df.module.isin(modules_name)]
+    return df.set_index("module")["execution_time (sec)"].to_dict()
 
 
-def _retry_modules_failed(modules_execution_results, country_data_getter):
+def _retry_modules_failed(
+    modules_execution_results, country_data_getter, backend="threading", timeout=None, max_memory=None
+):
     modules_failed = [m["module_name"] for m in modules_execution_results if m["success"] is False]
     logger.info(f"\n---\n\nRETRIES ({len(modules_failed)})")
-    modules_execution_results = []
-    for module_name in modules_failed:
-        modules_execution_results.append(country_data_getter.run(module_name))
+    scheduler = ModuleScheduler(modules_failed, {}, n_jobs=1)
+    modules_execution_results = _run_modules(scheduler, country_data_getter, backend, timeout, max_memory)
     modules_failed_retrial = [m["module_name"] for m in modules_execution_results if m["success"] is False]
     if len(modules_failed_retrial) > 0:
         failed_str = "\n".join([f"* {m}" for m in modules_failed_retrial])
         print(f"\n---\n\nFAILED\nThe following scripts failed to run ({len(modules_failed_retrial)}):\n{failed_str}")
 
 
-def _print_timing(t0, t_sec_1, df_time):
+def _print_host_stats():
+    df = session_stats()
+    if not df.empty:
+        print("HTTP DETAILS")
+        print(f"Top 20 most time consuming hosts (retries absorbed: {df.retries.sum()}):")
+        print(df.head(20))
+        print("---")
+
+
+def _print_timing(t0, t_sec_1, df_time, t_sec_predicted=None):
     t_min_1 = round(t_sec_1 / 60, 2)
     t_sec_2 = round(time.time() - t0, 2)
     t_min_2 = round(t_sec_2 / 60, 2)
@@ -187,6 +269,13 @@ def _print_timing(t0, t_sec_1, df_time):
     print(f"Took {t_sec_1} seconds (i.e. {t_min_1} minutes).")
     print(f"Top 20 most time consuming scripts:")
     print(df_time[["execution_time (sec)"]].head(20))
+    df_killed = df_time[df_time.status.isin(["timeout", "memory", "killed"])]
+    if not df_killed.empty:
+        print(f"\nKilled scripts ({len(df_killed)}):")
+        print(df_killed[["execution_time (sec)", "status"]])
     print(f"\nTook {t_sec_2} seconds (i.e. {t_min_2} minutes) [AFTER RETRIALS].")
+    if t_sec_predicted is not None:
+        print(f"\nPredicted runtime: {t_sec_predicted} seconds (i.e. {round(t_sec_predicted / 60, 2)} minutes).")
+        print(f"Achieved runtime: {t_sec_1} seconds (i.e. {t_min_1} minutes) [BEFORE RETRIALS].")
     print("---")
     return t_sec_1, t_min_1, t_sec_2, t_min_2
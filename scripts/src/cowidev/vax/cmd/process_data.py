@@ -1,13 +1,17 @@
 import os
 
+from joblib import Parallel, delayed
 import pandas as pd
 
 from cowidev.vax.utils.gsheets import VaccinationGSheet
-from cowidev.vax.process import process_location
+from cowidev.vax.process import process_location, ProcessManifest
+from cowidev.vax.process.manifest import METRICS
 from cowidev.vax.cmd.utils import get_logger, print_eoe
+from cowidev.vax.utils.checks import BatchChecker
 from pandas.core.base import DataError
 from pandas.errors import ParserError
 from cowidev.utils import paths
+from cowidev.utils.columnar import export_intermediate
 
 
 logger = get_logger()
@@ -20,12 +24,109 @@ def read_csv(filepath):
         raise ParserError(f"Error tokenizing data from file {filepath}")
 
 
+def _process(df):
+    """Process location data, without sanity checks. Returns the processed data and the error raised, if any."""
+    try:
+        return process_location(df, checks=False), None
+    except Exception as err:
+        return None, err
+
+
+def _check(vax: list, skip_monotonic: dict, skip_anomaly: dict) -> dict:
+    """Run sanity checks on processed data of all locations at once. Returns error messages by location."""
+    if not vax:
+        return {}
+    report = BatchChecker(
+        pd.concat(vax, ignore_index=True),
+        monotonic_check_skip=skip_monotonic,
+        anomaly_check_skip=skip_anomaly,
+    ).run()
+    return {
+        location: "\n".join(
+            f"{row.check} -- {row.message}" + (f" Check: {row.date.date()}" if pd.notnull(row.date) else "")
+            for row in df.itertuples()
+        )
+        for location, df in report.groupby("location")
+    }
+
+
+def _plan(vax: list, manifest: ProcessManifest, skip_complete: list, skip_monotonic: dict, skip_anomaly: dict):
+    """Decide which locations to process.
+
+    Returns:
+        tuple: Results of locations whose last processed file is reused (by location), locations to process (pairs
+                of location and data), and hashes of the inputs of each location (by location, if `manifest` is given).
+    """
+    results = {}
+    jobs = []
+    input_hashes = {}
+    for df in vax:
+        country = df.loc[0, "location"]
+        if country.lower() in skip_complete:
+            logger.info(f"{country}: SKIPPED 🚧")
+            continue
+        if manifest is not None:
+            input_hashes[country] = manifest.input_hash(
+                df, skip_monotonic.get(country, []), skip_anomaly.get(country, [])
+            )
+            df_processed = manifest.load(country, input_hashes[country], paths.out_vax(country, public=True))
+            if df_processed is not None:
+                results[country] = (df_processed, None)
+                logger.info(f"{country}: UNCHANGED ♻️")
+                continue
+        jobs.append((country, df))
+    return results, jobs, input_hashes
+
+
+def _process_all(jobs: list, parallel: bool, n_jobs: int) -> dict:
+    """Process locations (pairs of location and data), serially or on `n_jobs` worker processes.
+
+    Returns:
+        dict: Processed data and error raised (if any), by location.
+    """
+    if parallel:
+        outputs = Parallel(n_jobs=n_jobs)(delayed(_process)(df) for _, df in jobs)
+    else:
+        outputs = [_process(df) for _, df in jobs]
+    return {country: output for (country, _), output in zip(jobs, outputs)}
+
+
+def _export(vax: list, results: dict, processed: dict, manifest: ProcessManifest, input_hashes: dict):
+    """Export processed locations, in input order. Locations reused from the manifest are not exported again.
+
+    Returns:
+        tuple: Valid data of all locations (list), and errors by location (dict).
+    """
+    vax_valid = []
+    errors = {}
+    for df in vax:
+        country = df.loc[0, "location"]
+        if country not in results:
+            continue
+        df, err = results[country]
+        if err is not None:
+            errors[country] = err
+            logger.error(f"{country}: FAILED ❌ {err}")
+            continue
+        vax_valid.append(df)
+        if country in processed:
+            filepath = paths.out_vax(country, public=True)
+            df.to_csv(filepath, index=False)
+            if manifest is not None:
+                manifest.update(country, input_hashes[country], filepath)
+            logger.info(f"{country}: SUCCESS ✅")
+    return vax_valid, errors
+
+
 def main_process_data(
     gsheets_api,
     google_spreadsheet_vax_id: str,
     skip_complete: list = None,
     skip_monotonic: dict = {},
     skip_anomaly: dict = {},
+    incremental: bool = False,
+    parallel: bool = False,
+    n_jobs: int = -2,
 ):
     print("-- Processing data... --")
     # Get data from sheets
@@ -52,27 +153,39 @@ def main_process_data(
 
     # vax = [v for v in vax if v.location.iloc[0] == "Pakistan"]  # DEBUG
     # Process locations
-    def _process_location(df):
-        monotonic_check_skip = skip_monotonic.get(df.loc[0, "location"], [])
-        anomaly_check_skip = skip_anomaly.get(df.loc[0, "location"], [])
-        return process_location(df, monotonic_check_skip, anomaly_check_skip)
-
-    logger.info("Processing and exporting data...")
-    vax_valid = []
     for df in vax:
         if "location" not in df:
             raise ValueError(f"Column `location` missing. df: {df.tail(5)}")
-        country = df.loc[0, "location"]
-        if country.lower() not in skip_complete:
-            df = _process_location(df)
-            vax_valid.append(df)
-            # Export
-            df.to_csv(paths.out_vax(country, public=True), index=False)
-            logger.info(f"{country}: SUCCESS ✅")
-        else:
-            logger.info(f"{country}: SKIPPED 🚧")
+    # Locations with unchanged inputs reuse their last processed file
+    manifest = ProcessManifest(paths.SCRIPTS.TMP_VAX_MANIFEST) if incremental else None
+
+    logger.info("Processing and exporting data...")
+    results, jobs, input_hashes = _plan(vax, manifest, skip_complete, skip_monotonic, skip_anomaly)
+    processed = _process_all(jobs, parallel, n_jobs)
+    results.update(processed)
+
+    # Sanity checks on all processed locations at once
+    errors_check = _check(
+        [df for df, err in processed.values() if err is None],
+        skip_monotonic=skip_monotonic,
+        skip_anomaly=skip_anomaly,
+    )
+    results.update({country: (None, ValueError(err)) for country, err in errors_check.items()})
+
+    # Collect results in input order, report all errors at once
+    vax_valid, errors = _export(vax, results, processed, manifest, input_hashes)
+    if manifest is not None:
+        manifest.save(locations=[df.location.iloc[0] for df in vax_valid])
+    if errors:
+        raise ValueError(
+            f"Processing failed for {len(errors)} location(s):\n"
+            + "\n".join(f"* {country}: {err}" for country, err in errors.items())
+        )
     df = pd.concat(vax_valid).sort_values(by=["location", "date"])
-    df.to_csv(paths.SCRIPTS.TMP_VAX, index=False)
+    # Typed copy for generate-dataset (metrics as Int64, dates parsed)
+    cols = df.columns.intersection(METRICS).tolist()
+    df[cols] = df[cols].astype("Int64")
+    export_intermediate(df.assign(date=pd.to_datetime(df.date)), paths.SCRIPTS.TMP_VAX, paths.SCRIPTS.TMP_VAX_COLUMNAR)
     gsheet.metadata.to_csv(paths.SCRIPTS.TMP_VAX_META, index=False)
     logger.info("Exported ✅")
     print_eoe()
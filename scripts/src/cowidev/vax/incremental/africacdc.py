@@ -4,8 +4,9 @@ import pandas as pd
 
 from cowidev.utils.clean import clean_date
 from cowidev.utils.web import request_json
+from cowidev.utils.web.singleflight import read_csv_shared
 from cowidev.vax.utils.incremental import increment
-from cowidev.vax.utils.orgs import WHO_VACCINES, ACDC_COUNTRIES, ACDC_VACCINES
+from cowidev.vax.utils.orgs import WHO_VACCINES, ACDC_COUNTRIES, ACDC_VACCINES, WHO_VACCINATION_DATA_URL
 from cowidev.vax.cmd.utils import get_logger
 
 
@@ -83,8 +84,8 @@ class AfricaCDC:
         return vaccines
 
     def pipe_vaccine_who(self, df: pd.DataFrame) -> pd.DataFrame:
-        url = "https://covid19.who.int/who-data/vaccination-data.csv"
-        df_who = pd.read_csv(url, usecols=["ISO3", "VACCINES_USED"]).rename(columns={"VACCINES_USED": "vaccine"})
+        df_who = read_csv_shared(WHO_VACCINATION_DATA_URL)[["ISO3", "VACCINES_USED"]]
+        df_who = df_who.rename(columns={"VACCINES_USED": "vaccine"})
         df_who = df_who.dropna(subset=["vaccine"])
         df = df.merge(df_who, left_on="ISO_3_CODE", right_on="ISO3")
         df = df.assign(
@@ -1,11 +1,13 @@
 import re
-import time
 
 import pandas as pd
 
 from cowidev.utils.clean import clean_count, extract_clean_date
-from cowidev.utils.web.scraping import get_driver
-from cowidev.vax.utils.incremental import merge_with_current_data
+from selenium.webdriver.common.by import By
+
+from cowidev.utils.web.scraping import get_driver, wait_for_elements
+from cowidev.vax.utils.files import export_locations
+from cowidev.vax.utils.incremental import select_output_columns
 from cowidev.utils import paths
 
 
@@ -21,7 +23,7 @@ class China:
         data = []
         with get_driver(firefox=True) as driver:
             driver.get(self.source_url)
-            time.sleep(5)
+            wait_for_elements(driver, By.CSS_SELECTOR, "li>a")
             links = self._get_links(driver)
             for link in links:
                 data_ = self._parse_data(driver, link)
@@ -61,8 +63,7 @@ class China:
         if not df.empty:
             df = df.pipe(self.pipeline)
             # print(df.tail())
-            df = merge_with_current_data(df, output_file)
-            df.to_csv(output_file, index=False)
+            export_locations(df, merge_on="date", transform=select_output_columns)
 
 
 def main():
@@ -1,22 +1,19 @@
-import time
-
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
 
 from cowidev.utils.clean import clean_count, clean_date
+from cowidev.utils.web.scraping import pooled_driver, wait_for_elements
 from cowidev.vax.utils.incremental import enrich_data, increment
 
 
 def read(source: str) -> pd.Series:
-    op = Options()
-    op.add_argument("--headless")
-
-    with webdriver.Chrome(options=op) as driver:
+    with pooled_driver() as driver:
         driver.get(source)
-        time.sleep(3)
+        h5s = wait_for_elements(
+            driver, By.TAG_NAME, "h5", condition=lambda elems: any("Acumulados al" in e.text for e in elems)
+        )
 
-        for h5 in driver.find_elements_by_tag_name("h5"):
+        for h5 in h5s:
 
             if "Primera dosis" in h5.text:
                 people_vaccinated = clean_count(h5.find_element_by_xpath("./preceding-sibling::div").text)
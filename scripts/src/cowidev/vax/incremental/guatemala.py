@@ -1,9 +1,9 @@
 import re
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
 
 from cowidev.utils.clean import clean_count, clean_date
+from cowidev.utils.web.scraping import pooled_driver, wait_for_element
 from cowidev.vax.utils.incremental import increment
 
 
@@ -15,13 +15,11 @@ def main():
         "vaccine": "Moderna, Oxford/AstraZeneca",
     }
 
-    op = Options()
-    op.add_argument("--headless")
-    with webdriver.Chrome(options=op) as driver:
+    with pooled_driver() as driver:
         driver.maximize_window()  # For maximizing window
         driver.implicitly_wait(20)  # gives an implicit wait for 20 seconds
         driver.get(data["source_url"])
-        driver.find_element_by_class_name("fa-syringe").click()
+        wait_for_element(driver, By.CLASS_NAME, "fa-syringe", clickable=True).click()
         date = driver.find_element_by_class_name("logo").text
         dose1 = driver.find_element_by_id("dosisaplicadas1").find_element_by_tag_name("h3").text
         dose2 = driver.find_element_by_id("dosisaplicadas2").find_element_by_tag_name("h3").text
@@ -1,5 +1,4 @@
 import re
-import time
 import urllib3
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -11,7 +10,7 @@ from selenium.webdriver.support import expected_conditions as EC
 
 from cowidev.utils.clean import clean_count
 from cowidev.utils.clean.dates import localdate
-from cowidev.utils.web.scraping import get_soup, get_driver
+from cowidev.utils.web.scraping import get_soup, pooled_driver
 from cowidev.vax.utils.incremental import enrich_data, increment
 
 
@@ -25,10 +24,9 @@ class Jordan:
 
     def _parse_data(self) -> pd.Series:
 
-        with get_driver(headless=True) as driver:
+        with pooled_driver() as driver:
             # Main page
             driver.get(self._get_iframe_url())
-            time.sleep(5)
 
             data_blocks = WebDriverWait(driver, 30).until(
                 EC.visibility_of_all_elements_located((By.CLASS_NAME, "card"))
@@ -1,16 +1,15 @@
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
 
 from cowidev.utils.clean import clean_count, clean_date
+from cowidev.utils.web.scraping import pooled_driver, wait_for_element
 from cowidev.vax.utils.incremental import increment, enrich_data
 
 
 def read(source: str) -> pd.Series:
-    op = Options()
-    op.add_argument("--headless")
-    with webdriver.Chrome(options=op) as driver:
+    with pooled_driver() as driver:
         driver.get(source)
+        wait_for_element(driver, By.ID, "vaccinated_1")
         people_vaccinated, people_fully_vaccinated = parse_vaccinations(driver)
         date = parse_date(driver)
     return pd.Series(
@@ -22,13 +21,13 @@ def read(source: str) -> pd.Series:
     )
 
 
-def parse_vaccinations(driver: webdriver.Chrome) -> tuple:
+def parse_vaccinations(driver) -> tuple:
     people_vaccinated = clean_count(driver.find_element_by_id("vaccinated_1").text)
     people_fully_vaccinated = clean_count(driver.find_element_by_id("vaccinated_2").text)
     return people_vaccinated, people_fully_vaccinated
 
 
-def parse_date(driver: webdriver.Chrome) -> str:
+def parse_date(driver) -> str:
     elem = driver.find_element_by_class_name("tabl_vactination")
     date_str_raw = pd.read_html(elem.get_attribute("innerHTML"))[0].iloc[-1, -1]
     return clean_date(date_str_raw, "*данные на %d.%m.%Y")
@@ -7,7 +7,8 @@ import pandas as pd
 import PyPDF2
 
 from cowidev.utils.clean import clean_count
-from cowidev.vax.utils.incremental import merge_with_current_data
+from cowidev.vax.utils.files import export_locations
+from cowidev.vax.utils.incremental import select_output_columns
 from cowidev.utils.web import get_soup
 from cowidev.utils import paths
 
@@ -123,8 +124,7 @@ class Kenya:
 
     def export(self):
         df = self.read().pipe(self.pipeline)
-        df = merge_with_current_data(df, self.output_file)
-        df.to_csv(self.output_file, index=False)
+        export_locations(df, merge_on="date", transform=select_output_columns)
 
 
 def main():
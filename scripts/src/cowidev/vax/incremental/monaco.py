@@ -6,7 +6,8 @@ import pandas as pd
 
 from cowidev.utils.clean import clean_count, clean_date
 from cowidev.utils.web.scraping import get_soup
-from cowidev.vax.utils.incremental import merge_with_current_data
+from cowidev.vax.utils.files import export_locations
+from cowidev.vax.utils.incremental import select_output_columns
 from cowidev.utils import paths
 
 
@@ -135,9 +136,11 @@ class Monaco:
         df = self.read(last_update)
         if not df.empty and "people_vaccinated" in df.columns:
             df = df.pipe(self.pipeline)
-            df = merge_with_current_data(df, output_file)
-            df = df.pipe(self.pipe_drop_duplicates)
-            df.to_csv(output_file, index=False)
+            export_locations(
+                df,
+                merge_on="date",
+                transform=lambda df: df.pipe(select_output_columns).pipe(self.pipe_drop_duplicates),
+            )
 
 
 def main():
@@ -1,14 +1,21 @@
-import os
-import time
-from glob import glob
+import tempfile
 
 import pandas as pd
+from selenium.webdriver.common.by import By
 
 from cowidev.utils.clean import clean_date
-from cowidev.utils.web.scraping import get_soup, get_driver
+from cowidev.utils.web.scraping import (
+    get_soup,
+    pooled_driver,
+    wait_for_download,
+    wait_for_element,
+    wait_for_stable_text,
+    wait_for_windows,
+)
+from cowidev.utils.web.singleflight import read_csv_shared
 from cowidev.vax.utils.files import get_file_encoding
 from cowidev.vax.utils.incremental import increment
-from cowidev.vax.utils.orgs import WHO_VACCINES, PAHO_COUNTRIES
+from cowidev.vax.utils.orgs import WHO_VACCINES, PAHO_COUNTRIES, WHO_VACCINATION_DATA_URL
 from cowidev.vax.cmd.utils import get_logger
 
 
@@ -18,7 +25,6 @@ logger = get_logger()
 class PAHO:
     def __init__(self) -> None:
         self.source_url = "https://ais.paho.org/imm/IM_DosisAdmin-Vacunacion.asp"
-        self._download_path = "/tmp"
         self.columns_mapping = {
             "Country/ Territory": "location",
             "Country code": "country_code",
@@ -42,60 +48,46 @@ class PAHO:
         return url
 
     def _parse_data(self, url: str):
-        with get_driver(download_folder=self._download_path) as driver:
+        with tempfile.TemporaryDirectory() as download_path, pooled_driver(download_folder=download_path) as driver:
             # Go to page
             driver.get(url)
-            time.sleep(7.5)
             # Go to tab
-            driver.find_element_by_id("tableauTabbedNavigation_tab_2").click()
-            time.sleep(5)
+            wait_for_element(driver, By.ID, "tableauTabbedNavigation_tab_2", timeout=60, clickable=True).click()
             # Download data
             self._download_csv(driver, "Crosstab", "RDT: Overview Table")
             # Load downloadded file
-            filename = self._get_downloaded_filename()
+            filename = wait_for_download(download_path, "csv")
             df = pd.read_csv(filename, sep="\t", encoding=get_file_encoding(filename), thousands=",")
-            os.remove(filename)
             df = df.assign(date=self._parse_date(driver))
         return df
 
+    def _click(self, driver, by: str, value: str):
+        wait_for_element(driver, by, value, clickable=True).click()
+
     def _download_csv(self, driver, option: str, filename: str):
         # Click on download
-        driver.find_element_by_id("download-ToolbarButton").click()
-        time.sleep(1)
+        self._click(driver, By.ID, "download-ToolbarButton")
         # Click on Crosstab
-        driver.find_element_by_xpath(f"//button[contains(text(),'{option}')]").click()
-        time.sleep(3)
+        self._click(driver, By.XPATH, f"//button[contains(text(),'{option}')]")
         # Select RDT Overview option
-        driver.find_element_by_xpath(f"//span[contains(text(),'{filename}')]").click()
-        time.sleep(2)
+        self._click(driver, By.XPATH, f"//span[contains(text(),'{filename}')]")
         # Choose CSV
-        driver.find_element_by_xpath("//div[contains(text(),'CSV')]").click()
-        time.sleep(2)
+        self._click(driver, By.XPATH, "//div[contains(text(),'CSV')]")
         # Select RDT Overview option
         # driver.find_element_by_xpath(f"//span[contains(text(),'{filename}')]").click()
         # time.sleep(2)
         # Download
-        driver.find_element_by_xpath("//button[contains(text(),'Download')]").click()
-        time.sleep(5)
+        self._click(driver, By.XPATH, "//button[contains(text(),'Download')]")
 
     def _parse_date(self, driver):
-        driver.find_element_by_id("tabZoneId87").click()
-        time.sleep(1)
-        driver.find_element_by_id("download-ToolbarButton").click()
-        time.sleep(2)
-        driver.find_element_by_xpath(f"//button[contains(text(),'Data')]").click()
-        time.sleep(4)
-        window_after = driver.window_handles[1]
+        self._click(driver, By.ID, "tabZoneId87")
+        self._click(driver, By.ID, "download-ToolbarButton")
+        self._click(driver, By.XPATH, f"//button[contains(text(),'Data')]")
+        window_after = wait_for_windows(driver, 2)[1]
         driver.switch_to.window(window_after)
-        time.sleep(2)
-        date_str = driver.find_element_by_tag_name("tbody").text
+        date_str = wait_for_stable_text(driver, By.TAG_NAME, "tbody")
         return clean_date(date_str, "%m/%d/%Y")
 
-    def _get_downloaded_filename(self):
-        files = glob(os.path.join(self._download_path, "*.csv"))
-        # print(files)
-        return max(files, key=os.path.getctime)
-
     def pipe_check_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         df.columns = df.columns.str.replace(" \[\d.*", "", regex=True)
         columns_missing = set(self.columns_mapping).difference(df.columns)
@@ -129,8 +121,8 @@ class PAHO:
         )
 
     def pipe_vaccine(self, df: pd.DataFrame) -> pd.DataFrame:
-        url = "https://covid19.who.int/who-data/vaccination-data.csv"
-        df_who = pd.read_csv(url, usecols=["ISO3", "VACCINES_USED"]).rename(columns={"VACCINES_USED": "vaccine"})
+        df_who = read_csv_shared(WHO_VACCINATION_DATA_URL)[["ISO3", "VACCINES_USED"]]
+        df_who = df_who.rename(columns={"VACCINES_USED": "vaccine"})
         df_who = df_who.dropna(subset=["vaccine"])
         df_who = df_who.assign(
             vaccine=df_who.vaccine.apply(
@@ -1,9 +1,8 @@
-import time
-
 import pandas as pd
+from selenium.webdriver.common.by import By
 
 from cowidev.utils.clean import clean_count, extract_clean_date
-from cowidev.utils.web.scraping import get_driver
+from cowidev.utils.web.scraping import pooled_driver, wait_for_elements
 from cowidev.vax.utils.incremental import enrich_data, increment
 
 
@@ -19,10 +18,12 @@ class Philippines:
         return pd.Series(data=self._parse_data())
 
     def _parse_data(self) -> dict:
-        with get_driver() as driver:
+        with pooled_driver() as driver:
             driver.get(self.source_url)
-            time.sleep(2)
-            spans = [span for span in driver.find_elements_by_tag_name("span") if span.get_attribute("data-text")]
+            spans = wait_for_elements(
+                driver, By.CSS_SELECTOR, "span[data-text]", condition=lambda elems: len(self._non_empty(elems)) > 18
+            )
+            spans = self._non_empty(spans)
             # Date
             date = extract_clean_date(
                 spans[6].text.replace("Sept", "Sep"),
@@ -56,6 +57,9 @@ class Philippines:
             "date": date,
         }
 
+    def _non_empty(self, spans: list) -> list:
+        return [span for span in spans if span.get_attribute("data-text")]
+
     def pipe_location(self, ds: pd.Series) -> pd.Series:
         return enrich_data(ds, "location", self.location)
 
@@ -1,12 +1,11 @@
 import re
-import time
 
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
 
 from cowidev.utils.clean import clean_count
 from cowidev.utils.clean.dates import localdate
+from cowidev.utils.web.scraping import pooled_driver, wait_for_stable_text
 from cowidev.vax.utils.incremental import enrich_data, increment
 
 
@@ -15,14 +14,9 @@ def read(source: str) -> pd.Series:
 
 
 def connect_parse_data(source: str) -> pd.Series:
-    op = Options()
-    op.add_argument("--headless")
-
-    with webdriver.Chrome(options=op) as driver:
+    with pooled_driver() as driver:
         driver.get(source)
-        time.sleep(5)
-
-        total_vaccinations = clean_count(driver.find_element_by_id("counter1").text)
+        total_vaccinations = clean_count(wait_for_stable_text(driver, By.ID, "counter1"))
         # people_vaccinated_share = driver.find_element_by_id("counter4").text
         # assert "One dose" in people_vaccinated_share
         # people_fully_vaccinated_share = driver.find_element_by_id("counter4a").text
@@ -6,7 +6,8 @@ from cowidev.utils.clean.dates import clean_date_series
 import pandas as pd
 
 from cowidev.utils.clean import clean_date
-from cowidev.vax.utils.incremental import merge_with_current_data
+from cowidev.vax.utils.files import export_locations
+from cowidev.vax.utils.incremental import select_output_columns
 from cowidev.utils import paths, clean_count
 
 
@@ -118,8 +119,7 @@ class Spain:
         df = self.read(last_update)
         if df is not None:
             df = df.pipe(self.pipeline)
-            df = merge_with_current_data(df, output_file)
-            df.to_csv(output_file, index=False)
+            export_locations(df, merge_on="date", transform=select_output_columns)
 
 
 def main():
@@ -1,20 +1,24 @@
-import time
-
 import pandas as pd
+from selenium.webdriver.common.by import By
 
 from cowidev.utils.clean import clean_count
 from cowidev.utils.clean.dates import localdate
-from cowidev.utils.web.scraping import get_driver
+from cowidev.utils.web.scraping import pooled_driver, wait_for_elements
 from cowidev.vax.utils.incremental import enrich_data, increment
 
 
 def read(source: str) -> pd.Series:
 
-    with get_driver() as driver:
+    with pooled_driver() as driver:
         driver.get(source)
-        time.sleep(10)
-
-        for block in driver.find_elements_by_class_name("kpimetric"):
+        blocks = wait_for_elements(
+            driver,
+            By.CLASS_NAME,
+            "kpimetric",
+            condition=lambda elems: sum("dosis" in e.text and "%" not in e.text for e in elems) >= 2,
+        )
+
+        for block in blocks:
             if "1ste dosis" in block.text and "%" not in block.text:
                 people_partly_vaccinated = clean_count(block.find_element_by_class_name("valueLabel").text)
             elif "2de dosis" in block.text and "%" not in block.text:
@@ -10,7 +10,8 @@ from pdfreader import SimplePDFViewer
 from cowidev.utils.clean import clean_count
 from cowidev.utils.clean.dates import clean_date, localdate
 from cowidev.utils.web.scraping import get_soup
-from cowidev.vax.utils.incremental import merge_with_current_data
+from cowidev.vax.utils.files import export_locations
+from cowidev.vax.utils.incremental import select_output_columns
 from cowidev.utils import paths
 
 
@@ -162,8 +163,7 @@ class Thailand:
         df = self.read(last_update)
         if not df.empty:
             df = df.pipe(self.pipeline)
-            df = merge_with_current_data(df, output_file)
-            df.to_csv(output_file, index=False)
+            export_locations(df, merge_on="date", transform=select_output_columns)
         else:
             print(1)
 
@@ -3,7 +3,9 @@ import re
 import pandas as pd
 
 from cowidev.utils.clean import clean_count, extract_clean_date
-from cowidev.utils.web.scraping import get_driver
+from selenium.webdriver.common.by import By
+
+from cowidev.utils.web.scraping import pooled_driver, wait_for_element
 from cowidev.vax.utils.incremental import enrich_data, increment
 
 
@@ -16,9 +18,9 @@ class UnitedArabEmirates:
         return self._parse_data()
 
     def _parse_data(self) -> pd.Series:
-        with get_driver() as driver:
+        with pooled_driver() as driver:
             driver.get(self.source_url)
-            elem = driver.find_element_by_class_name("total_vaccination")
+            elem = wait_for_element(driver, By.CLASS_NAME, "total_vaccination")
             total_vaccinations = self._parse_total_vaccinations(elem)
             population = self._estimate_population(elem, total_vaccinations)
             return pd.Series(
@@ -1,6 +1,9 @@
-from cowidev.utils.web import get_driver
+from selenium.webdriver.common.by import By
+
+from cowidev.utils.web.scraping import pooled_driver, wait_for_element
 from cowidev.utils.clean import clean_count, clean_date
-from cowidev.vax.utils.incremental import merge_with_current_data
+from cowidev.vax.utils.files import export_locations
+from cowidev.vax.utils.incremental import select_output_columns
 from cowidev.utils import paths
 from cowidev.vax.utils.utils import build_vaccine_timeline
 
@@ -21,8 +24,9 @@ class Uzbekistan:
 
     def read(self, last_update):
         data = []
-        with get_driver() as driver:
+        with pooled_driver() as driver:
             driver.get(self.source_url)
+            wait_for_element(driver, By.ID, "accordionExample")
             self._click_detail_buttons(driver)
             elems = self._get_elems(driver)
             for elem in elems:
@@ -88,8 +92,7 @@ class Uzbekistan:
         output_file = paths.out_vax(self.location)
         last_update = pd.read_csv(output_file).date.max()
         df = self.read(last_update).pipe(self.pipeline)
-        df = merge_with_current_data(df, output_file)
-        df.to_csv(output_file, index=False)
+        export_locations(df, merge_on="date", transform=select_output_columns)
 
 
 def main():
@@ -5,7 +5,8 @@ import pandas as pd
 
 from cowidev.utils.clean import clean_count, clean_string, clean_date
 from cowidev.utils.web.scraping import get_soup
-from cowidev.vax.utils.incremental import merge_with_current_data
+from cowidev.vax.utils.files import export_locations
+from cowidev.vax.utils.incremental import select_output_columns
 from cowidev.utils import paths
 
 
@@ -72,8 +73,7 @@ class Vietnam:
         df = self.read(last_update)
         if df is not None:
             df = df.pipe(self.pipeline)
-            df = merge_with_current_data(df, output_file)
-            df.to_csv(output_file, index=False)
+            export_locations(df, merge_on="date", transform=select_output_columns)
 
 
 def main():
@@ -3,7 +3,8 @@ import numpy as np
 
 from cowidev.vax.utils.incremental import increment
 from cowidev.vax.utils.checks import VACCINES_ONE_DOSE
-from cowidev.vax.utils.orgs import WHO_VACCINES, WHO_COUNTRIES
+from cowidev.vax.utils.orgs import WHO_VACCINES, WHO_COUNTRIES, WHO_VACCINATION_DATA_URL
+from cowidev.utils.web.singleflight import read_csv_shared
 from cowidev.vax.cmd.utils import get_logger
 
 
@@ -20,11 +21,11 @@ ADDITIONAL_VACCINES_USED = {
 
 class WHO:
     def __init__(self) -> None:
-        self.source_url = "https://covid19.who.int/who-data/vaccination-data.csv"
+        self.source_url = WHO_VACCINATION_DATA_URL
         self.source_url_ref = "https://covid19.who.int/"
 
     def read(self) -> pd.DataFrame:
-        return pd.read_csv(self.source_url)
+        return read_csv_shared(self.source_url)
 
     def pipe_checks(self, df: pd.DataFrame) -> pd.DataFrame:
         if len(df) > 300:
@@ -37,8 +38,7 @@ class WHO:
         return df
 
     def pipe_rename_countries(self, df: pd.DataFrame) -> pd.DataFrame:
-        df["COUNTRY"] = df.COUNTRY.replace(WHO_COUNTRIES)
-        return df
+        return df.assign(COUNTRY=df.COUNTRY.replace(WHO_COUNTRIES))
 
     def pipe_filter_entries(self, df: pd.DataFrame) -> pd.DataFrame:
         """Get valid entries:
@@ -1,11 +1,12 @@
+import importlib
 import pkgutil
 
 
-__all__ = []
+# Modules are listed from file names, and only imported on first access (e.g. `importlib.import_module`)
+__all__ = [module_name for _, module_name, _ in pkgutil.iter_modules(__path__) if module_name not in ["utils", "base"]]
 
 
-for loader, module_name, _is_pkg in pkgutil.walk_packages(__path__):
-    __all__.append(module_name)
-    __all__ = [m for m in __all__ if m not in ["utils", "base"]]
-    _module = loader.find_module(module_name).load_module(module_name)
-    globals()[module_name] = _module
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
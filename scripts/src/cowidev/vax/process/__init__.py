@@ -1,4 +1,5 @@
 from cowidev.vax.process.process import process_location
+from cowidev.vax.process.manifest import ProcessManifest
 
 
-__all__ = ["process_location"]
+__all__ = ["process_location", "ProcessManifest"]
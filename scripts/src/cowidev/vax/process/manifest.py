@@ -0,0 +1,93 @@
+"""Per-country manifest of processed vaccination data.
+
+For each location, the manifest stores a hash of its inputs to `process_location` (raw data and check-skip
+configuration) along with a hash of the processed file it produced. A location whose inputs and processed file are
+unchanged since the last run can reuse that file instead of being processed (and sanity-checked) again.
+"""
+from datetime import datetime
+import hashlib
+import json
+import os
+import tempfile
+
+import pandas as pd
+
+
+# Bump whenever `process_location` changes its output, so that all locations are processed again
+VERSION = 1
+METRICS = [
+    "total_vaccinations",
+    "people_vaccinated",
+    "people_partly_vaccinated",
+    "people_fully_vaccinated",
+    "total_boosters",
+]
+
+
+class ProcessManifest:
+    """Manifest of processed locations, stored as a JSON file.
+
+    Args:
+        path (str): Path to the manifest file. Missing or invalid files are treated as an empty manifest.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries = self._load()
+
+    def input_hash(self, df: pd.DataFrame, monotonic_check_skip: list = [], anomaly_check_skip: list = []) -> str:
+        """Hash of the inputs of `process_location` for a location."""
+        h = hashlib.sha256()
+        h.update(f"{VERSION}".encode())
+        h.update(json.dumps(list(map(str, df.columns))).encode())
+        h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+        h.update(json.dumps([monotonic_check_skip, anomaly_check_skip], sort_keys=True, default=str).encode())
+        # Output depends on the current date if data reaches it (partial days are filtered out)
+        today = datetime.now().date()
+        if pd.to_datetime(df.date, dayfirst=True).max().date() >= today:
+            h.update(f"{today}".encode())
+        return h.hexdigest()
+
+    def load(self, location: str, input_hash: str, path: str) -> pd.DataFrame:
+        """Load processed data of `location` from `path`, if it was generated from inputs with hash `input_hash`.
+
+        Returns None if the inputs changed, or if the file at `path` is missing or was modified since.
+        """
+        entry = self.entries.get(location)
+        if entry is None or entry["input"] != input_hash:
+            return None
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return None
+        if hashlib.sha256(content).hexdigest() != entry["output"]:
+            return None
+        df = pd.read_csv(path)
+        cols = df.columns.intersection(METRICS).tolist()
+        df[cols] = df[cols].astype("Int64")
+        return df
+
+    def update(self, location: str, input_hash: str, path: str):
+        """Record that the processed data of `location` at `path` was generated from inputs with hash `input_hash`."""
+        with open(path, "rb") as f:
+            output_hash = hashlib.sha256(f.read()).hexdigest()
+        self.entries[location] = {"input": input_hash, "output": output_hash}
+
+    def save(self, locations: list = None):
+        """Write manifest to disk. If `locations` is given, entries of other locations are dropped."""
+        if locations is not None:
+            self.entries = {loc: self.entries[loc] for loc in locations if loc in self.entries}
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=os.path.dirname(self.path) or ".", suffix=".tmp", delete=False
+        ) as tmp:
+            json.dump(self.entries, tmp, indent=2, sort_keys=True)
+        os.replace(tmp.name, self.path)
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
@@ -5,7 +5,9 @@ from cowidev.vax.utils.checks import country_df_sanity_checks
 from cowidev.utils.clean import clean_urls, clean_date
 
 
-def process_location(df: pd.DataFrame, monotonic_check_skip: list = [], anomaly_check_skip: list = []) -> pd.DataFrame:
+def process_location(
+    df: pd.DataFrame, monotonic_check_skip: list = [], anomaly_check_skip: list = [], checks: bool = True
+) -> pd.DataFrame:
     # print(df.tail(1))
     # Only report up to previous day to avoid partial reporting
     df = df.assign(date=pd.to_datetime(df.date, dayfirst=True))
@@ -42,12 +44,13 @@ def process_location(df: pd.DataFrame, monotonic_check_skip: list = [], anomaly_
     usecols = df.columns.intersection(usecols).tolist()
     df = df[usecols]
     df = df.sort_values(by="date")
-    # Sanity checks
-    country_df_sanity_checks(
-        df,
-        monotonic_check_skip=monotonic_check_skip,
-        anomaly_check_skip=anomaly_check_skip,
-    )
+    # Sanity checks (skipped if run afterwards with BatchChecker)
+    if checks:
+        country_df_sanity_checks(
+            df,
+            monotonic_check_skip=monotonic_check_skip,
+            anomaly_check_skip=anomaly_check_skip,
+        )
     # Strip
     df = df.applymap(lambda x: x.strip() if isinstance(x, str) else x)
     # Date format
@@ -4,6 +4,8 @@ from datetime import datetime
 import pandas as pd
 from cowidev.vax.tracking.vaccines import vaccines_comparison_with_who
 from cowidev.utils.utils import get_project_dir
+from cowidev.utils.web.singleflight import read_csv_shared
+from cowidev.vax.utils.orgs import WHO_VACCINATION_DATA_URL
 
 
 CURRENT_DIR = os.path.abspath(os.path.dirname(__file__))
@@ -11,8 +13,7 @@ CURRENT_DIR = os.path.abspath(os.path.dirname(__file__))
 
 def get_who_data():
     # Load WHO
-    url = "https://covid19.who.int/who-data/vaccination-data.csv"
-    df_who = pd.read_csv(url, usecols=["ISO3", "COUNTRY", "DATA_SOURCE"])
+    df_who = read_csv_shared(WHO_VACCINATION_DATA_URL)[["ISO3", "COUNTRY", "DATA_SOURCE"]]
     df_who = df_who.rename(columns={"COUNTRY": "location_WHO"})
     # Countries WHO relies on us
     df_who = df_who.assign(reporting_to_WHO=df_who.DATA_SOURCE == "OWID")
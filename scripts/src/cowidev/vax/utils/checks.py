@@ -237,6 +237,177 @@ class CountryChecker:
         self.check_metrics()
 
 
+class BatchChecker:
+    """Run the checks of `CountryChecker` on data from several locations at once.
+
+    All checks are vectorized over the concatenated data (one row per location and date), and every violation is
+    collected instead of stopping at the first one.
+
+    Args:
+        df (pd.DataFrame): Vaccination data of one or more locations.
+        monotonic_check_skip (dict, optional): Monotonic check exceptions, by location. Values are lists of
+                                                dictionaries with keys `date` and `metrics`.
+        anomalies (bool, optional): Set to True to run anomaly checks. Defaults to True.
+        anomaly_check_skip (dict, optional): Anomaly check exceptions, by location. Same format as
+                                                `monotonic_check_skip`.
+    """
+
+    REPORT_COLUMNS = ["location", "check", "metric", "date", "message"]
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        monotonic_check_skip: dict = {},
+        anomalies: bool = True,
+        anomaly_check_skip: dict = {},
+    ):
+        self.df = df.assign(date=pd.to_datetime(df.date)).reset_index(drop=True)
+        # Metrics as floats. Processed data has missing metrics as object columns of `pd.NA`, which cannot be cast
+        # with `astype(float)`
+        self.df = self.df.assign(**{col: pd.to_numeric(self.df[col]).astype(float) for col in self.metrics_present})
+        self.skip_monotonic = self._skip_check_ids(monotonic_check_skip)
+        self.anomalies = anomalies
+        self.skip_anomaly = self._skip_check_ids(anomaly_check_skip)
+        self._report = []
+
+    def _skip_check_ids(self, check_skip):
+        records = [
+            (location, pd.Timestamp(x["date"]), metric)
+            for location, skips in check_skip.items()
+            for x in (skips or [])
+            for metric in (x["metrics"] if isinstance(x["metrics"], list) else [x["metrics"]])
+        ]
+        return pd.MultiIndex.from_tuples(records, names=["location", "date", "metric"]) if records else None
+
+    @property
+    def metrics_present(self):
+        cols = ["total_vaccinations", "people_vaccinated", "people_fully_vaccinated", "total_boosters"]
+        return [col for col in cols if col in self.df.columns]
+
+    def _add(self, df, check, message, metric=None):
+        """Add rows of `df` (with columns `location` and `date`) to the report."""
+        if df.empty:
+            return
+        self._report.append(
+            pd.DataFrame(
+                {
+                    "location": df["location"].values,
+                    "check": check,
+                    "metric": metric,
+                    "date": df["date"].values if "date" in df else pd.NaT,
+                    "message": message,
+                }
+            )
+        )
+
+    def _not_skipped(self, df, metric, skip_ids):
+        if skip_ids is None or df.empty:
+            return df
+        ids = pd.MultiIndex.from_arrays(
+            [df["location"], df["date"].dt.normalize(), [metric] * len(df)], names=["location", "date", "metric"]
+        )
+        return df[~ids.isin(skip_ids)]
+
+    def check_column_names(self):
+        cols = ["total_vaccinations", "vaccine", "date", "location", "source_url"]
+        cols_missing = [col for col in cols if col not in self.df.columns]
+        if cols_missing:
+            self._add(
+                self.df.drop_duplicates("location")[["location"]], "columns", f"df missing column(s): {cols_missing}."
+            )
+        return not cols_missing
+
+    def check_source_url(self):
+        df = self.df[self.df.source_url.isnull()].drop_duplicates("location")
+        self._add(df, "source_url", "Invalid source_url! NaN values found.")
+
+    def check_vaccine(self):
+        df = self.df[self.df.vaccine.isnull()].drop_duplicates("location")
+        self._add(df, "vaccine", "Invalid vaccine! NaN values found.")
+        vaccines = self.df[["location", "date", "vaccine"]].dropna(subset=["vaccine"]).drop_duplicates(
+            ["location", "vaccine"]
+        )
+        vaccines = vaccines.assign(vaccine=vaccines.vaccine.str.split(", ")).explode("vaccine")
+        vaccines = vaccines[~vaccines.vaccine.isin(VACCINES_ACCEPTED)]
+        for vaccine, df in vaccines.groupby("vaccine"):
+            self._add(df.drop_duplicates("location"), "vaccine", f"Invalid vaccine detected! Check {[vaccine]}.")
+
+    def check_date(self):
+        df = self.df[self.df.date.isnull()].drop_duplicates("location")
+        self._add(df, "date", "Invalid dates! NaN values found.")
+        df = self.df[self.df.date < datetime(2020, 12, 1)]
+        self._add(df, "date", "Invalid dates! Date before 2020-12-01.")
+        df = self.df[self.df.date.notnull() & self.df.duplicated(subset=["location", "date"], keep=False)]
+        self._add(df, "date", "Check `date` field, there are duplicates.")
+
+    def check_location(self):
+        df = self.df[self.df.location.isnull()]
+        self._add(df, "location", "Invalid location! NaN values found.")
+
+    def check_metrics(self):
+        df = self.df.dropna(subset=["location", "date"]).sort_values(by=["location", "date"])
+        self._check_metrics_monotonic(df)
+        self._check_metrics_inequalities(df)
+        if self.anomalies:
+            self._check_metrics_anomalies(df)
+
+    def _check_metrics_monotonic(self, df: pd.DataFrame):
+        for col in self.metrics_present:
+            _x = df.dropna(subset=[col])
+            msk = _x.groupby("location")[col].diff() < 0
+            wrong_rows = self._not_skipped(_x[msk.fillna(False).astype(bool)], col, self.skip_monotonic)
+            self._add(wrong_rows, "monotonic", f"Column {col} must be monotonically increasing!", metric=col)
+
+    def _check_metrics_inequalities(self, df: pd.DataFrame):
+        inequalities = [
+            ("total_vaccinations", "people_vaccinated"),
+            ("total_vaccinations", "people_fully_vaccinated"),
+            ("total_vaccinations", "total_boosters"),
+            ("people_vaccinated", "people_fully_vaccinated"),
+        ]
+        for col_greater, col_lower in inequalities:
+            if (col_greater in df.columns) and (col_lower in df.columns):
+                msk = (df[col_greater].astype(float) < df[col_lower].astype(float)).fillna(False).astype(bool)
+                message = f"{col_greater} can't be < {col_lower}!"
+                self._add(df[msk], "inequality", message, metric=f"{col_greater},{col_lower}")
+
+    def _check_metrics_anomalies(self, df, th=6):
+        window_size = "7d"
+        for metric in self.metrics_present:
+            # Get metric values above 10,000
+            df_metric = df.loc[df[metric].astype(float) > 10000, ["location", "date", metric]]
+            if df_metric.empty:
+                continue
+            df_metric = df_metric.assign(**{metric: df_metric[metric].astype(float)})
+            # Compute rolling average, 7 days, within each location. NaNs are filled with non-smoothed values
+            # Rows are sorted by location and date, i.e. in the same order as the grouped rolling output
+            m = df_metric.groupby("location").rolling(window_size, on="date", min_periods=2)[metric].mean()
+            m = pd.Series(m.values, index=df_metric.index).groupby(df_metric.location).shift(1)
+            m = m.fillna(df_metric[metric])
+            # Compute ratio between rolling average and value
+            t = df_metric[metric] / (m + 1e-9)
+            wrong_rows = self._not_skipped(df_metric[t > th], metric, self.skip_anomaly)
+            self._add(wrong_rows, "anomaly", "Potential anomalies found ⚠️", metric=metric)
+
+    def run(self) -> pd.DataFrame:
+        """Run all checks.
+
+        Returns:
+            pd.DataFrame: Report with one row per violation, with columns `location`, `check`, `metric`, `date` and
+                            `message`. Empty if all checks passed.
+        """
+        self._report = []
+        if self.check_column_names():
+            self.check_source_url()
+            self.check_vaccine()
+            self.check_date()
+            self.check_location()
+            self.check_metrics()
+        if not self._report:
+            return pd.DataFrame(columns=self.REPORT_COLUMNS)
+        return pd.concat(self._report, ignore_index=True)[self.REPORT_COLUMNS]
+
+
 def validate_vaccines(df, vaccines_accepted, vaccines_raw=None):
     if vaccines_raw != None:
         vaccines_wrong = set(vaccines_raw).difference(vaccines_accepted)
@@ -2,9 +2,11 @@ import os
 import json
 from pathlib import Path
 
+from joblib import Parallel, delayed
 import pandas as pd
 from bs4 import UnicodeDammit
 from cowidev.utils import paths
+from cowidev.utils.utils import merge_with_csv
 
 
 STATIC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "_static"))
@@ -103,6 +105,45 @@ def export_metadata(df: pd.DataFrame, source_name: str, source_url: str, output_
     )
 
 
+def export_locations(
+    df: pd.DataFrame,
+    columns: list = None,
+    merge_on=None,
+    transform=None,
+    n_jobs: int = -1,
+    **kwargs,
+):
+    """Export data of several locations, to one file per location (as given by `paths.out_vax`).
+
+    Data is split by location in a single pass, and files are written (and merged) in parallel threads.
+
+    Args:
+        df (pd.DataFrame): Data of all locations. Must have column `location`.
+        columns (list, optional): Columns to export, in order. Defaults to None (all columns).
+        merge_on (str or list, optional): Key column(s). If given, data is merged with the current file of each
+                                            location: current rows whose key is not in the new data are kept (upsert).
+                                            Defaults to None (files are overwritten).
+        transform (callable, optional): Function applied to the data of each location (after merging it, if
+                                        `merge_on` is given) before exporting it. Defaults to None.
+        n_jobs (int, optional): Number of threads. Defaults to -1 (as many as CPUs).
+        kwargs: Arguments for `paths.out_vax` (e.g. `age=True`).
+    """
+    if "location" not in df:
+        raise ValueError("df must have column `location`.")
+    Parallel(n_jobs=n_jobs, backend="threading")(
+        delayed(_export_location)(df_c, paths.out_vax(location, **kwargs), columns, merge_on, transform)
+        for location, df_c in df.groupby("location", sort=False, observed=True)
+    )
+
+
+def _export_location(df: pd.DataFrame, output_path: str, columns: list, merge_on, transform):
+    if merge_on is not None:
+        df = merge_with_csv(df, output_path, on=merge_on)
+    if transform is not None:
+        df = transform(df)
+    df.to_csv(output_path, columns=columns, index=False)
+
+
 def get_file_encoding(file_path):
     with open(file_path, "rb") as file:
         content = file.read()
@@ -1,14 +1,28 @@
 import os
+import csv
 import datetime
+import io
 import re
 import numbers
 
 import pandas as pd
-import requests
 from cowidev.utils import paths
+from cowidev.utils.utils import merge_with_csv
+from cowidev.utils.web import sessions
 
 
 GH_LINK = "https://github.com/owid/covid-19-data/raw/master/public/data/vaccinations/country_data"
+COLUMNS_INT = [
+    "total_vaccinations",
+    "people_vaccinated",
+    "people_partly_vaccinated",
+    "people_fully_vaccinated",
+    "total_boosters",
+]
+# Bytes read from the end of a file to get its last two rows
+TAIL_SIZE = 64 * 1024
+# Locations without a file in GitHub (looked up once per process)
+_GH_MISSING = set()
 
 
 def enrich_data(ds: pd.Series, row, value) -> pd.Series:
@@ -40,6 +54,20 @@ def increment(
     )
     _from_gh_to_scripts(location)
     filepath_automated = paths.out_vax(location)
+    # Update only the last row of the file in output/, if possible
+    if os.path.isfile(filepath_automated) and _increment_tail(
+        filepath=filepath_automated,
+        location=location,
+        total_vaccinations=total_vaccinations,
+        date=date,
+        vaccine=vaccine,
+        source_url=source_url,
+        people_vaccinated=people_vaccinated,
+        people_partly_vaccinated=people_partly_vaccinated,
+        people_fully_vaccinated=people_fully_vaccinated,
+        total_boosters=total_boosters,
+    ):
+        return
     # Update file in output/
     if os.path.isfile(filepath_automated):
         df = _increment(
@@ -67,29 +95,32 @@ def increment(
             people_fully_vaccinated=people_fully_vaccinated,
             total_boosters=total_boosters,
         )
+    _format_df(df).to_csv(paths.out_vax(location), index=False)
+    # print(f"NEW: {total_vaccinations} doses on {date}")
+
+
+def _format_df(df: pd.DataFrame) -> pd.DataFrame:
     # To Integer type
-    col_ints = [
-        "total_vaccinations",
-        "people_vaccinated",
-        "people_partly_vaccinated",
-        "people_fully_vaccinated",
-        "total_boosters",
-    ]
-    col_ints_have = [col for col in col_ints if col in df.columns]
+    col_ints_have = [col for col in COLUMNS_INT if col in df.columns]
     for col in col_ints_have:
         df[col] = df[col].astype("Int64").fillna(pd.NA)
 
-    df = df[["location", "date", "vaccine", "source_url"] + col_ints_have]
-    df.to_csv(paths.out_vax(location), index=False)
-    # print(f"NEW: {total_vaccinations} doses on {date}")
+    return df[["location", "date", "vaccine", "source_url"] + col_ints_have]
 
 
 def _from_gh_to_scripts(location):
     filepath_automated = paths.out_vax(location)
+    if os.path.isfile(filepath_automated) or location in _GH_MISSING:
+        return
     filepath_public = f"{GH_LINK}/{location}.csv".replace(" ", "%20")
-    # Move from public to output folder
-    if not os.path.isfile(filepath_automated) and requests.get(filepath_public).ok:
-        pd.read_csv(filepath_public).to_csv(filepath_automated, index=False)
+    # Move from public to output folder (formatted as by `increment`, so that its last row can be updated in place)
+    response = sessions.request("get", filepath_public)
+    if response.ok:
+        df = pd.read_csv(io.BytesIO(response.content)).sort_values("date")
+        _format_df(df).to_csv(filepath_automated, index=False)
+    elif response.status_code == 404:
+        # Only a missing file is remembered, other errors (e.g. rate limits) are retried on the next call
+        _GH_MISSING.add(location)
 
 
 def _check_fields(
@@ -189,6 +220,114 @@ def _increment(
     return df.sort_values("date")
 
 
+def _increment_tail(
+    filepath,
+    location,
+    total_vaccinations,
+    date,
+    vaccine,
+    source_url,
+    people_vaccinated=None,
+    people_partly_vaccinated=None,
+    people_fully_vaccinated=None,
+    total_boosters=None,
+) -> bool:
+    """Same as `_increment` followed by export, but only reading and writing the last row of the file.
+
+    Assumes that the file is sorted by date and that `total_vaccinations` does not decrease (as left by `increment`),
+    so that its last row holds the latest date and largest value.
+
+    Returns:
+        bool: False if the update can't be done in place (e.g. it adds a column). The file is then left untouched.
+    """
+    metrics = {
+        "total_vaccinations": total_vaccinations,
+        "people_vaccinated": people_vaccinated,
+        "people_partly_vaccinated": people_partly_vaccinated,
+        "people_fully_vaccinated": people_fully_vaccinated,
+        "total_boosters": total_boosters,
+    }
+    if not all(pd.isnull(v) or float(v).is_integer() for v in metrics.values()):
+        return False
+    with open(filepath, "rb+") as f:
+        tail = _read_tail(f)
+        if tail is None:
+            return False
+        columns, last, offset_last = tail
+        # Older or not larger figure
+        if total_vaccinations <= float(last["total_vaccinations"]) or date < last["date"]:
+            return True
+        if date == last["date"]:
+            # Update last row. Metrics are overwritten even if None (except partly vaccinated)
+            update = {k: v for k, v in metrics.items() if k != "people_partly_vaccinated" or v is not None}
+            row = {**last, **{k: _format_int(v) for k, v in update.items()}, "source_url": source_url}
+            f.seek(offset_last)
+        else:
+            # Append row
+            update = {k: v for k, v in metrics.items() if v is not None}
+            row = {
+                **{c: "" for c in columns},
+                "location": location,
+                "date": date,
+                "vaccine": vaccine,
+                "source_url": source_url,
+                **{k: _format_int(v) for k, v in update.items()},
+            }
+        if set(update) - set(columns):
+            return False
+        f.write(_format_line([row[c] for c in columns]))
+        f.truncate()
+    return True
+
+
+def _read_tail(f):
+    """Read the header and last row of CSV file `f` (opened in binary mode, as written by `increment`).
+
+    Returns:
+        tuple: Columns, last row (dictionary) and its offset in the file. None if the file does not have the expected
+                format (columns, line endings, last two rows sorted by date).
+    """
+    header = f.readline()
+    size = f.seek(0, os.SEEK_END)
+    start = max(size - TAIL_SIZE, len(header))
+    f.seek(start)
+    tail = f.read()
+    if b"\r" in header or b"\r" in tail or not tail.endswith(b"\n"):
+        return None
+    lines = tail[:-1].split(b"\n")
+    if start > len(header):
+        # First line is probably partial
+        if len(lines) < 3:
+            return None
+        lines = lines[1:]
+    columns = _parse_line(header.rstrip(b"\n"))
+    if columns != ["location", "date", "vaccine", "source_url"] + [c for c in COLUMNS_INT if c in columns]:
+        return None
+    rows = [_parse_line(line) for line in lines[-2:]]
+    if any(len(row) != len(columns) for row in rows) or "total_vaccinations" not in columns:
+        return None
+    rows = [dict(zip(columns, row)) for row in rows]
+    if rows[-1]["total_vaccinations"] == "":
+        return None
+    if len(rows) == 2 and rows[0]["date"] >= rows[-1]["date"]:
+        return None
+    return columns, rows[-1], size - len(lines[-1]) - 1
+
+
+def _parse_line(line: bytes) -> list:
+    return next(csv.reader([line.decode("utf-8")]))
+
+
+def _format_line(values: list) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(values)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _format_int(value) -> str:
+    return "" if pd.isnull(value) else str(int(value))
+
+
 def _build_df(
     location,
     total_vaccinations,
@@ -221,21 +360,18 @@ def _build_df(
 
 
 def merge_with_current_data(df: pd.DataFrame, filepath: str) -> pd.DataFrame:
-    col_ints = [
-        "total_vaccinations",
-        "people_vaccinated",
-        "people_partly_vaccinated",
-        "people_fully_vaccinated",
-        "total_boosters",
-    ]
-    # Load current data
-    if os.path.isfile(filepath):
-        df_current = pd.read_csv(filepath)
-        # Merge
-        df_current = df_current[~df_current.date.isin(df.date)]
-        df = pd.concat([df, df_current]).sort_values(by="date")
-        # Int values
-    col_ints = list(df.columns.intersection(col_ints))
+    # Current rows with a date in `df` are replaced
+    return merge_with_csv(df, filepath, on="date").pipe(select_output_columns)
+
+
+def select_output_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast metrics to integers and keep output columns.
+
+    Use it as `transform` of `export_locations(..., merge_on="date")` to export data as `merge_with_current_data`
+    does.
+    """
+    # Int values
+    col_ints = list(df.columns.intersection(COLUMNS_INT))
     if col_ints:
         df[col_ints] = df[col_ints].astype("Int64").fillna(pd.NA)
 
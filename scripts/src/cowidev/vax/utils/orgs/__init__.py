@@ -20,6 +20,9 @@ ACDC_COUNTRIES, ACDC_VACCINES = get_org_constants(__AFRICACDC_CONFIG)
 __SPC_CONFIG = os.path.join(__CURRENT_DIR, "spc_config.yaml")
 SPC_COUNTRIES, SPC_VACCINES = get_org_constants(__SPC_CONFIG)
 
+# Files shared by several modules
+WHO_VACCINATION_DATA_URL = "https://covid19.who.int/who-data/vaccination-data.csv"
+
 # ECDC
 __ECDC_CONFIG = os.path.join(__CURRENT_DIR, "ecdc_config.yaml")
 ECDC_COUNTRIES, ECDC_VACCINES = get_org_constants(__ECDC_CONFIG)
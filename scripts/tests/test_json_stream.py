@@ -0,0 +1,43 @@
+import io
+import json
+
+import pytest
+
+from cowidev.utils.json_stream import iter_json_array, write_json_array
+
+
+OBJECTS = [
+    1,
+    2.5,
+    1e3,
+    -0.25e-2,
+    123456,
+    "a string, with ] and \" inside",
+    True,
+    None,
+    [],
+    {},
+    {"location": "Spain", "data": [{"date": "2021-01-01", "total_vaccinations": 82834, "share": 0.75}] * 50},
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1024 ** 2])
+@pytest.mark.parametrize("compact", [False, True])
+def test_iter_json_array(chunk_size, compact):
+    f = io.StringIO()
+    write_json_array(OBJECTS, f, compact=compact)
+    f.seek(0)
+    assert list(iter_json_array(f, chunk_size=chunk_size)) == json.loads(f.getvalue())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024 ** 2])
+@pytest.mark.parametrize("text", ["[1,2.5,1e3,123456]", " [ 1 , 2.5 , -1E-3 ]\n", "[]", "[12]"])
+def test_iter_json_array_numbers(chunk_size, text):
+    assert list(iter_json_array(io.StringIO(text), chunk_size=chunk_size)) == json.loads(text)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1024 ** 2])
+@pytest.mark.parametrize("text", ["", "{}", "[1,", "[1 2]", "[1.]"])
+def test_iter_json_array_invalid(chunk_size, text):
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO(text), chunk_size=chunk_size))